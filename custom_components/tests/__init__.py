@@ -0,0 +1 @@
+"""Tests for the Todo List integration."""
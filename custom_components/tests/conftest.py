@@ -0,0 +1,114 @@
+"""Fixtures for the Todo List integration tests."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from homeassistant.components.todo import (
+    DOMAIN as TODO_DOMAIN,
+)
+from homeassistant.components.todo import (
+    TodoItem,
+    TodoItemStatus,
+    TodoListEntity,
+    TodoListEntityFeature,
+)
+from homeassistant.const import CONF_ENTITY_ID, CONF_NAME
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.todo_list.const import (
+    CONF_DISPLAY_HOURS,
+    CONF_DISPLAY_POSITION,
+    CONF_TIME,
+    DOMAIN,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+    from homeassistant.core import HomeAssistant
+
+SOURCE_ENTITY_ID = "todo.chores"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(
+    enable_custom_integrations: None,  # noqa: ARG001
+) -> None:
+    """Load the integration from custom_components in every test."""
+    return
+
+
+@pytest.fixture(autouse=True)
+def no_http_server() -> Generator[None]:
+    """Keep the frontend dependency from opening a socket."""
+    with patch("homeassistant.components.http.start_http_server_and_save_config"):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def config_dir(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Keep history files out of the shared test config directory."""
+    hass.config.config_dir = str(tmp_path)
+
+
+class MockTodoListEntity(TodoListEntity):
+    """In-memory todo list to reset."""
+
+    _attr_should_poll = False
+    _attr_supported_features = (
+        TodoListEntityFeature.CREATE_TODO_ITEM
+        | TodoListEntityFeature.UPDATE_TODO_ITEM
+        | TodoListEntityFeature.DELETE_TODO_ITEM
+    )
+
+    def __init__(self, items: list[TodoItem]) -> None:
+        """Initialize the list."""
+        self.entity_id = SOURCE_ENTITY_ID
+        self._attr_name = "Chores"
+        self._attr_todo_items = items
+
+    async def async_update_todo_item(self, item: TodoItem) -> None:
+        """Replace an item."""
+        self._attr_todo_items = [
+            item if existing.uid == item.uid else existing
+            for existing in self._attr_todo_items or []
+        ]
+        self.async_write_ha_state()
+
+
+@pytest.fixture
+async def source_list(hass: HomeAssistant) -> MockTodoListEntity:
+    """Set up the todo list the reset list points at."""
+    assert await async_setup_component(hass, TODO_DOMAIN, {})
+    entity = MockTodoListEntity(
+        [
+            TodoItem(summary="Dishes", uid="1", status=TodoItemStatus.COMPLETED),
+            TodoItem(summary="Laundry", uid="2", status=TodoItemStatus.NEEDS_ACTION),
+        ]
+    )
+    await hass.data[TODO_DOMAIN].async_add_entities([entity])
+    return entity
+
+
+@pytest.fixture
+def config_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Return a reset list config entry for the source list."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Chores",
+        unique_id=f"{SOURCE_ENTITY_ID}_00:00:00",
+        data={
+            CONF_NAME: "Chores",
+            CONF_ENTITY_ID: SOURCE_ENTITY_ID,
+            CONF_TIME: "00:00:00",
+            CONF_DISPLAY_POSITION: "before",
+            CONF_DISPLAY_HOURS: 2,
+        },
+    )
+    entry.add_to_hass(hass)
+    return entry
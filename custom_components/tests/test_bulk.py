@@ -0,0 +1,75 @@
+"""Tests for bulk item status changes."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from homeassistant.core import Context
+from homeassistant.exceptions import Unauthorized
+
+from custom_components.todo_list.const import DOMAIN, SERVICE_SET_ITEMS_STATUS
+
+from .conftest import SOURCE_ENTITY_ID
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import (
+        MockConfigEntry,
+        MockUser,
+    )
+
+    from .conftest import MockTodoListEntity
+
+
+async def _async_set_all_completed(
+    hass: HomeAssistant, context: Context
+) -> dict[str, list[dict[str, str]]]:
+    """Mark every open item of the source list as completed."""
+    return await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_ITEMS_STATUS,
+        {
+            "entity_id": SOURCE_ENTITY_ID,
+            "status_filter": "needs_action",
+            "status": "completed",
+        },
+        blocking=True,
+        context=context,
+        return_response=True,
+    )
+
+
+async def test_set_items_status(
+    hass: HomeAssistant,
+    source_list: MockTodoListEntity,
+    config_entry: MockConfigEntry,
+    hass_admin_user: MockUser,
+) -> None:
+    """Items picked by status are updated and reported per item."""
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    response = await _async_set_all_completed(hass, Context(user_id=hass_admin_user.id))
+
+    assert response == {"items": [{"uid": "2", "result": "updated"}]}
+    assert all(item.status == "completed" for item in source_list.todo_items)
+
+
+async def test_set_items_status_requires_control(
+    hass: HomeAssistant,
+    source_list: MockTodoListEntity,
+    config_entry: MockConfigEntry,
+    hass_read_only_user: MockUser,
+) -> None:
+    """A user who may not control the source list cannot change it."""
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    with pytest.raises(Unauthorized):
+        await _async_set_all_completed(hass, Context(user_id=hass_read_only_user.id))
+
+    assert [item.status for item in source_list.todo_items] == [
+        "completed",
+        "needs_action",
+    ]
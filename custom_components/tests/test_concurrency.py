@@ -0,0 +1,158 @@
+"""Tests for the adaptive concurrency limiter."""
+
+from __future__ import annotations
+
+import asyncio
+from itertools import pairwise
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.todo_list.concurrency import AdaptiveConcurrencyLimiter
+from custom_components.todo_list.const import ADAPTIVE_MAX_CONCURRENCY
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+FAST = 0.01
+SLOW = 0.1
+
+
+class UpdateError(Exception):
+    """Raised by a failing item update."""
+
+
+class FakeClock:
+    """Monotonic clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        """Start at an arbitrary point in time."""
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Generator[FakeClock]:
+    """Drive the limiter's clock from the test."""
+    clock = FakeClock()
+    with patch("custom_components.todo_list.concurrency.time") as mock_time:
+        mock_time.monotonic.side_effect = clock.monotonic
+        yield clock
+
+
+async def _async_window(
+    limiter: AdaptiveConcurrencyLimiter,
+    clock: FakeClock,
+    latency: float,
+    *,
+    fail: bool = False,
+) -> None:
+    """Run one fully used window of calls that all take the same latency."""
+    release = asyncio.Event()
+
+    async def call() -> None:
+        await release.wait()
+        if fail:
+            raise UpdateError
+
+    tasks = [asyncio.create_task(limiter.async_run(call)) for _ in range(limiter.limit)]
+    # Let every call take its slot before time moves on
+    await asyncio.sleep(0)
+    clock.now += latency
+    release.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _async_grow(
+    limiter: AdaptiveConcurrencyLimiter, clock: FakeClock, limit: int
+) -> None:
+    """Run fast windows until the limit has grown to at least the given one."""
+    while limiter.limit < limit:
+        await _async_window(limiter, clock, FAST)
+
+
+async def test_limit_grows_by_one_per_full_window(clock: FakeClock) -> None:
+    """Fast, fully used windows raise the limit by about one each."""
+    limiter = AdaptiveConcurrencyLimiter()
+
+    limits = [limiter.limit]
+    for _ in range(2 * ADAPTIVE_MAX_CONCURRENCY):
+        await _async_window(limiter, clock, FAST)
+        limits.append(limiter.limit)
+
+    assert {after - before for before, after in pairwise(limits)} == {0, 1}
+    assert limits.index(ADAPTIVE_MAX_CONCURRENCY) <= ADAPTIVE_MAX_CONCURRENCY + 1
+    assert limits[-1] == ADAPTIVE_MAX_CONCURRENCY
+
+
+async def test_limit_only_grows_when_used(clock: FakeClock) -> None:
+    """Calls that leave slots free do not raise the limit."""
+    limiter = AdaptiveConcurrencyLimiter()
+    await _async_grow(limiter, clock, 4)
+    limit = limiter._limit  # noqa: SLF001
+
+    async def call() -> None:
+        clock.now += FAST
+
+    for _ in range(10):
+        await limiter.async_run(call)
+
+    assert limiter._limit == limit  # noqa: SLF001
+
+
+async def test_errors_halve_the_limit_once_per_window(clock: FakeClock) -> None:
+    """All calls of a window failing halve the limit once, not per call."""
+    limiter = AdaptiveConcurrencyLimiter()
+    await _async_grow(limiter, clock, ADAPTIVE_MAX_CONCURRENCY)
+
+    await _async_window(limiter, clock, FAST, fail=True)
+    assert limiter.limit == ADAPTIVE_MAX_CONCURRENCY // 2
+
+    await _async_window(limiter, clock, FAST, fail=True)
+    assert limiter.limit == ADAPTIVE_MAX_CONCURRENCY // 4
+
+
+async def test_rising_latency_backs_off(clock: FakeClock) -> None:
+    """A window that is much slower than the best seen halves the limit once."""
+    limiter = AdaptiveConcurrencyLimiter()
+    await _async_grow(limiter, clock, ADAPTIVE_MAX_CONCURRENCY)
+
+    await _async_window(limiter, clock, SLOW)
+
+    assert limiter.limit == ADAPTIVE_MAX_CONCURRENCY // 2
+    assert limiter.latency is not None
+    assert limiter.latency > FAST
+
+
+async def test_baseline_drifts_towards_a_slower_provider(clock: FakeClock) -> None:
+    """A provider that got slower for good lets the limit grow again."""
+    limiter = AdaptiveConcurrencyLimiter()
+    await _async_grow(limiter, clock, ADAPTIVE_MAX_CONCURRENCY)
+
+    lowest = limiter.limit
+    for _ in range(200):
+        await _async_window(limiter, clock, SLOW)
+        lowest = min(lowest, limiter.limit)
+
+    assert lowest < ADAPTIVE_MAX_CONCURRENCY
+    assert limiter.limit == ADAPTIVE_MAX_CONCURRENCY
+
+
+async def test_limit_stays_within_bounds(clock: FakeClock) -> None:
+    """The limit never leaves [min_limit, ADAPTIVE_MAX_CONCURRENCY]."""
+    limiter = AdaptiveConcurrencyLimiter(min_limit=2)
+    assert limiter.limit == 2  # noqa: PLR2004
+
+    for _ in range(3 * ADAPTIVE_MAX_CONCURRENCY):
+        await _async_window(limiter, clock, FAST)
+        assert limiter.limit <= ADAPTIVE_MAX_CONCURRENCY
+    assert limiter.limit == ADAPTIVE_MAX_CONCURRENCY
+
+    for _ in range(ADAPTIVE_MAX_CONCURRENCY):
+        await _async_window(limiter, clock, FAST, fail=True)
+        assert limiter.limit >= 2  # noqa: PLR2004
+    assert limiter.limit == 2  # noqa: PLR2004
@@ -0,0 +1,65 @@
+"""Tests for the completion history."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.todo_list.history import TodoListHistory
+
+if TYPE_CHECKING:
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+
+ITEMS = [
+    {"uid": str(index), "summary": f"Item {index}", "status": "completed"}
+    for index in range(20)
+]
+RESETS = 5
+
+
+async def test_overlapping_records_keep_one_index_per_uid(hass: HomeAssistant) -> None:
+    """Resets and queries running together do not intern a UID twice."""
+    await TodoListHistory(hass, "entry").async_record(ITEMS)
+
+    loads = json.loads
+
+    def slow_loads(line: str) -> Any:
+        """Widen the window in which the UIDs are being read."""
+        time.sleep(0.001)
+        return loads(line)
+
+    history = TodoListHistory(hass, "entry")
+    with patch("custom_components.todo_list.history.json.loads", slow_loads):
+        await asyncio.gather(
+            *(history.async_record(ITEMS) for _ in range(RESETS)),
+            *(history.async_query() for _ in range(RESETS)),
+        )
+
+    # Read back from disk, as after a restart
+    result = await TodoListHistory(hass, "entry").async_query()
+    assert [item["uid"] for item in result["items"]] == [item["uid"] for item in ITEMS]
+    assert all(item["seen"] == RESETS + 1 for item in result["items"])
+
+
+async def test_midnight_reset_counts_towards_the_day_before(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """A reset at 00:00 on Tuesday records Monday's completions."""
+    history = TodoListHistory(hass, "entry")
+    freezer.move_to(datetime(2024, 1, 9, tzinfo=dt_util.get_default_time_zone()))
+    await history.async_record(ITEMS[:1])
+
+    monday = await history.async_query(start=date(2024, 1, 8), end=date(2024, 1, 8))
+    assert monday["resets"] == 1
+    assert monday["items"][0]["by_weekday"]["mon"] == {"seen": 1, "completed": 1}
+    assert monday["items"][0]["by_weekday"]["tue"] == {"seen": 0, "completed": 0}
+
+    tuesday = await history.async_query(start=date(2024, 1, 9))
+    assert tuesday == {"resets": 0, "items": []}
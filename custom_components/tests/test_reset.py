@@ -0,0 +1,145 @@
+"""Tests for resetting the items of a reset list."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    async_capture_events,
+    async_fire_time_changed,
+)
+
+from custom_components.todo_list.const import (
+    DOMAIN,
+    EVENT_RESET_STARTED,
+    RESETTING_PUBLISH_DELAY,
+)
+from custom_components.todo_list.history import (
+    FLAG_COMPLETED,
+    RECORD,
+    TodoListHistory,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from .conftest import MockTodoListEntity
+
+RESET_ENTITY_ID = "todo_list.chores_with_reset"
+EARLIER_RESET = 1_700_000_000
+
+
+@pytest.mark.usefixtures("source_list")
+async def test_overlapping_resets_run_once(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+) -> None:
+    """A reset asked for while one is running is covered by that one."""
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    entity = hass.data[DOMAIN][config_entry.entry_id]["entity"]
+    started = async_capture_events(hass, EVENT_RESET_STARTED)
+
+    await asyncio.gather(entity.async_reset_items(), entity.async_reset_items())
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=RESETTING_PUBLISH_DELAY * 2)
+    )
+    await hass.async_block_till_done()
+
+    assert len(started) == 1
+    assert hass.states.get(RESET_ENTITY_ID).state == "active"
+    history = await hass.data[DOMAIN][config_entry.entry_id]["history"].async_query()
+    assert history["resets"] == 1
+
+
+async def test_reset_marks_completed_items_open(
+    hass: HomeAssistant,
+    source_list: MockTodoListEntity,
+    config_entry: MockConfigEntry,
+) -> None:
+    """Completed items of the source list are open again after a reset."""
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        DOMAIN, "reset_now", {"entity_id": RESET_ENTITY_ID}, blocking=True
+    )
+
+    assert [item.status for item in source_list.todo_items] == [
+        "needs_action",
+        "needs_action",
+    ]
+    assert hass.states.get(RESET_ENTITY_ID).state == "active"
+
+
+async def test_reset_survives_broken_history_files(
+    hass: HomeAssistant,
+    source_list: MockTodoListEntity,
+    config_entry: MockConfigEntry,
+) -> None:
+    """Writes cut short by a crash neither stop a reset nor skew the history."""
+    directory = Path(hass.config.path(".storage", f"{DOMAIN}_history"))
+    directory.mkdir(parents=True)
+    # A line that does not decode and a last line cut short
+    (directory / f"{config_entry.entry_id}.uids").write_bytes(
+        b'{"uid": "1", "summary": "Dishes"}\n{"uid": "2", "summ\n{"uid": "3"'
+    )
+    # Records pointing at the broken line and past the UIDs, then a partial one
+    (directory / f"{config_entry.entry_id}.log").write_bytes(
+        RECORD.pack(EARLIER_RESET, 0, FLAG_COMPLETED)
+        + RECORD.pack(EARLIER_RESET, 1, FLAG_COMPLETED)
+        + RECORD.pack(EARLIER_RESET, 7, FLAG_COMPLETED)
+        + bytes(RECORD.size // 2)
+    )
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        DOMAIN, "reset_now", {"entity_id": RESET_ENTITY_ID}, blocking=True
+    )
+
+    assert hass.states.get(RESET_ENTITY_ID).state == "active"
+    assert [item.status for item in source_list.todo_items] == [
+        "needs_action",
+        "needs_action",
+    ]
+
+    history = await hass.services.async_call(
+        DOMAIN,
+        "get_completion_history",
+        {"entity_id": RESET_ENTITY_ID},
+        blocking=True,
+        return_response=True,
+    )
+    assert history["resets"] == 2  # noqa: PLR2004
+    assert [
+        (item["uid"], item["seen"], item["completed"]) for item in history["items"]
+    ] == [("1", 2, 2), ("2", 1, 0)]
+
+
+async def test_reset_runs_when_history_fails(
+    hass: HomeAssistant,
+    source_list: MockTodoListEntity,
+    config_entry: MockConfigEntry,
+) -> None:
+    """The history is secondary, any error recording it is only logged."""
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    with patch.object(TodoListHistory, "async_record", side_effect=ValueError):
+        await hass.services.async_call(
+            DOMAIN, "reset_now", {"entity_id": RESET_ENTITY_ID}, blocking=True
+        )
+
+    assert hass.states.get(RESET_ENTITY_ID).state == "active"
+    assert [item.status for item in source_list.todo_items] == [
+        "needs_action",
+        "needs_action",
+    ]
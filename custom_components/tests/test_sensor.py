@@ -0,0 +1,62 @@
+"""Tests for the completion sensors."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from homeassistant.components.todo import DOMAIN as TODO_DOMAIN
+from homeassistant.components.todo import TodoItem, TodoItemStatus
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.todo_list.const import SENSOR_UPDATE_COOLDOWN
+
+from .conftest import SOURCE_ENTITY_ID, MockTodoListEntity
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+
+async def _async_cool_down(hass: HomeAssistant) -> None:
+    """Let the sensors write changes held back by the cooldown."""
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=SENSOR_UPDATE_COOLDOWN + 1)
+    )
+    await hass.async_block_till_done()
+
+
+@pytest.mark.usefixtures("source_list")
+async def test_sensors_follow_a_replaced_source_list(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+) -> None:
+    """The counts follow the source list after its integration reloads it."""
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.chores_completed").state == "1"
+
+    # A reload of the source integration replaces the entity object
+    await hass.data[TODO_DOMAIN].async_remove_entity(SOURCE_ENTITY_ID)
+    replacement = MockTodoListEntity(
+        [
+            TodoItem(summary="Dishes", uid="1", status=TodoItemStatus.COMPLETED),
+            TodoItem(summary="Laundry", uid="2", status=TodoItemStatus.COMPLETED),
+            TodoItem(summary="Plants", uid="3", status=TodoItemStatus.NEEDS_ACTION),
+        ]
+    )
+    await hass.data[TODO_DOMAIN].async_add_entities([replacement])
+    await _async_cool_down(hass)
+
+    assert hass.states.get("sensor.chores_completed").state == "2"
+    assert hass.states.get("sensor.chores_remaining").state == "1"
+
+    await replacement.async_update_todo_item(
+        TodoItem(summary="Plants", uid="3", status=TodoItemStatus.COMPLETED)
+    )
+    await _async_cool_down(hass)
+
+    assert hass.states.get("sensor.chores_completed").state == "3"
+    assert hass.states.get("sensor.chores_remaining").state == "0"
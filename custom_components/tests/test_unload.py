@@ -0,0 +1,146 @@
+"""Tests for unloading and reloading reset lists."""
+
+from __future__ import annotations
+
+import gc
+import weakref
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.todo_list.const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+CYCLES = 300
+
+
+def _entry_refs(hass: HomeAssistant, entry: MockConfigEntry) -> list[weakref.ref]:
+    """Return weak references to the objects an entry creates."""
+    sensor = hass.data[SENSOR_DOMAIN].get_entity("sensor.chores_completed")
+    return [
+        weakref.ref(hass.data[DOMAIN][entry.entry_id]["entity"]),
+        weakref.ref(sensor._tracker),  # noqa: SLF001
+    ]
+
+
+def _alive(refs: list[weakref.ref]) -> list[Any]:
+    """Return the referenced objects that are still alive after collection."""
+    gc.collect()
+    return [obj for ref in refs if (obj := ref()) is not None]
+
+
+async def _async_snapshot(hass: HomeAssistant) -> dict[str, Any]:
+    """Return what an entry leaks if it does not clean up after itself."""
+    # Let short-lived timers such as registry saves and debouncer cooldowns
+    # run first, twice as the first poll of a new entity can start another
+    # cooldown, so only the timers that stay around are counted
+    for _ in range(2):
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=30))
+        await hass.async_block_till_done()
+
+    # Registries save with a delay through a timer and a final write listener,
+    # those come and go on their own and are not ours
+    return {
+        "bus_listeners": {
+            event_type: count
+            for event_type, count in hass.bus.async_listeners().items()
+            if event_type != EVENT_HOMEASSISTANT_FINAL_WRITE
+        },
+        # Time listeners end up as timer handles on the event loop
+        "timers": sum(
+            not handle.cancelled()
+            and not isinstance(getattr(handle._callback, "__self__", None), Store)  # noqa: SLF001
+            for handle in hass.loop._scheduled  # noqa: SLF001
+        ),
+        "entries": len(hass.data.get(DOMAIN, {})),
+        "services": sorted(hass.services.async_services_for_domain(DOMAIN)),
+    }
+
+
+@pytest.mark.usefixtures("source_list")
+async def test_unload_removes_everything(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+) -> None:
+    """Unloading an entry removes its entities, services and data."""
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("todo_list.chores_with_reset")
+    assert state.attributes["friendly_name"] == "Chores With Reset"
+    assert hass.states.get("sensor.chores_completed").state == "1"
+    assert hass.services.has_service(DOMAIN, "reset_now")
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert config_entry.state is ConfigEntryState.NOT_LOADED
+    assert hass.data[DOMAIN] == {}
+    assert not hass.services.has_service(DOMAIN, "reset_now")
+    assert not hass.services.has_service(DOMAIN, "get_completion_history")
+    # Registered once for the integration, not per entry
+    assert hass.services.has_service(DOMAIN, "set_items_status")
+
+
+@pytest.mark.usefixtures("source_list")
+async def test_setup_unload_cycles_do_not_leak(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+) -> None:
+    """Listeners, timers, data, services and memory stay flat over many cycles."""
+    # The first cycle sets up the integration itself, measure from there
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+    unloaded = await _async_snapshot(hass)
+
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    loaded = await _async_snapshot(hass)
+
+    refs: list[weakref.ref] = []
+    for _ in range(CYCLES):
+        refs.extend(_entry_refs(hass, config_entry))
+        assert await hass.config_entries.async_unload(config_entry.entry_id)
+        await hass.async_block_till_done()
+        assert await _async_snapshot(hass) == unloaded
+
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+        assert await _async_snapshot(hass) == loaded
+
+    # No entity or tracker of an unloaded entry is kept alive
+    assert _alive(refs) == []
+
+
+@pytest.mark.usefixtures("source_list")
+async def test_reload_cycles_do_not_leak(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+) -> None:
+    """Reloading an entry over and over leaves nothing behind."""
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    loaded = await _async_snapshot(hass)
+
+    refs: list[weakref.ref] = []
+    for _ in range(CYCLES):
+        refs.extend(_entry_refs(hass, config_entry))
+        assert await hass.config_entries.async_reload(config_entry.entry_id)
+        await hass.async_block_till_done()
+        assert config_entry.state is ConfigEntryState.LOADED
+        assert await _async_snapshot(hass) == loaded
+
+    # No entity or tracker replaced by a reload is kept alive
+    assert _alive(refs) == []
@@ -0,0 +1,65 @@
+"""Tests for the card websocket API."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from homeassistant.components.todo import DOMAIN as TODO_DOMAIN
+from homeassistant.components.todo import TodoItem, TodoItemStatus
+
+from .conftest import SOURCE_ENTITY_ID, MockTodoListEntity
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+    from pytest_homeassistant_custom_component.typing import (
+        MockHAClientWebSocket,
+        WebSocketGenerator,
+    )
+
+RESET_ENTITY_ID = "todo_list.chores_with_reset"
+
+
+async def _async_next_items(
+    client: MockHAClientWebSocket,
+) -> list[dict[str, Any]] | None:
+    """Return the items of the next streamed entry."""
+    msg = await client.receive_json(timeout=1)
+    assert msg["type"] == "event"
+    [entry] = msg["event"]["entries"]
+    assert entry["entity_id"] == RESET_ENTITY_ID
+    return entry["items"]
+
+
+@pytest.mark.usefixtures("source_list")
+async def test_subscription_follows_a_replaced_source_list(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Items keep streaming after the source integration reloads the list."""
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id(
+        {"type": "todo_list/items/subscribe", "entity_ids": [RESET_ENTITY_ID]}
+    )
+    assert (await client.receive_json())["success"]
+    assert [item["uid"] for item in await _async_next_items(client)] == ["1", "2"]
+
+    # A reload of the source integration replaces the entity object
+    await hass.data[TODO_DOMAIN].async_remove_entity(SOURCE_ENTITY_ID)
+    assert await _async_next_items(client) is None
+
+    replacement = MockTodoListEntity(
+        [TodoItem(summary="Plants", uid="3", status=TodoItemStatus.NEEDS_ACTION)]
+    )
+    await hass.data[TODO_DOMAIN].async_add_entities([replacement])
+    assert [item["uid"] for item in await _async_next_items(client)] == ["3"]
+
+    await replacement.async_update_todo_item(
+        TodoItem(summary="Plants", uid="3", status=TodoItemStatus.COMPLETED)
+    )
+    assert [item["status"] for item in await _async_next_items(client)] == ["completed"]
@@ -2,46 +2,98 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
-from homeassistant.components.http import StaticPathConfig
-from homeassistant.const import CONF_ENTITY_ID
+from homeassistant.auth.permissions.const import POLICY_CONTROL
+from homeassistant.components.todo import DOMAIN as TODO_DOMAIN
+from homeassistant.config_entries import SOURCE_IMPORT
+from homeassistant.const import CONF_ENTITY_ID, CONF_NAME, Platform
+from homeassistant.core import SupportsResponse
+from homeassistant.exceptions import (
+    ServiceValidationError,
+    Unauthorized,
+    UnknownUser,
+)
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_component import EntityComponent
 
 from .const import (
     CONF_TIME,
+    DATA_COMPONENT,
     DOMAIN,
+    IMPORT_BATCH_SIZE,
+    SERVICE_GET_COMPLETION_HISTORY,
+    SERVICE_RESET_NOW,
+    SERVICE_SET_ITEMS_STATUS,
     CONF_DISPLAY_POSITION,
     DEFAULT_DISPLAY_POSITION,
     CONF_DISPLAY_HOURS,
     DEFAULT_DISPLAY_HOURS,
 )
+from . import websocket_api
+from .bulk import async_set_items_status
 from .frontend import TodoListCardRegistration
+from .history import TodoListHistory
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
     from homeassistant.helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
 
-# Configuration schema
-CONFIG_SCHEMA = vol.Schema(
+# Configuration schema, a single list or a list of them
+LIST_SCHEMA = vol.Schema(
     {
-        DOMAIN: vol.Schema(
-            {
-                vol.Required(CONF_ENTITY_ID): cv.entity_id,
-                vol.Required(CONF_TIME): cv.time,
-            }
-        )
-    },
+        vol.Optional(CONF_NAME): cv.string,
+        vol.Required(CONF_ENTITY_ID): cv.entity_domain(TODO_DOMAIN),
+        vol.Required(CONF_TIME): cv.time,
+        vol.Optional(CONF_DISPLAY_POSITION, default=DEFAULT_DISPLAY_POSITION): vol.In(
+            ["before", "after"]
+        ),
+        vol.Optional(CONF_DISPLAY_HOURS, default=DEFAULT_DISPLAY_HOURS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=24)
+        ),
+    }
+)
+
+CONFIG_SCHEMA = vol.Schema(
+    {DOMAIN: vol.All(cv.ensure_list, [LIST_SCHEMA])},
     extra=vol.ALLOW_EXTRA,
 )
 
+RESET_NOW_SCHEMA = vol.Schema({vol.Optional(CONF_ENTITY_ID): cv.entity_ids})
+
+GET_COMPLETION_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_ENTITY_ID): cv.entity_domain(DOMAIN),
+        vol.Optional("start"): cv.date,
+        vol.Optional("end"): cv.date,
+        vol.Optional("uid"): cv.string,
+    }
+)
+
+ITEM_STATUSES = ["needs_action", "completed"]
+
+SET_ITEMS_STATUS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(CONF_ENTITY_ID): cv.entity_domain(TODO_DOMAIN),
+            vol.Exclusive("items", "selection"): vol.All(cv.ensure_list, [cv.string]),
+            vol.Exclusive("status_filter", "selection"): vol.In(ITEM_STATUSES),
+            vol.Required("status"): vol.In(ITEM_STATUSES),
+        }
+    ),
+    cv.has_at_least_one_key("items", "status_filter"),
+)
+
 # Define the platforms we support
-PLATFORMS = []
+PLATFORMS = [Platform.SENSOR]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -59,8 +111,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Register the entity directly
         from .todo_list import TodoListResetEntity
 
+        history = TodoListHistory(hass, entry.entry_id)
         entity = TodoListResetEntity(
-            hass, entry.entry_id, entity_id, reset_time, display_position, display_hours
+            hass,
+            entry.entry_id,
+            entity_id,
+            reset_time,
+            display_position,
+            display_hours,
+            history,
         )
 
         # Store the entity reference directly
@@ -70,24 +129,65 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             "display_position": display_position,
             "display_hours": display_hours,
             "entity": entity,  # Store direct reference to entity
+            "history": history,
         }
 
         # Register frontend
         cards = TodoListCardRegistration(hass)
         await cards.async_register()
+        entry.async_on_unload(cards.async_cancel)
+
+        # One device per list, the target for reset device triggers
+        device = dr.async_get(hass).async_get_or_create(
+            config_entry_id=entry.entry_id,
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=entry.title,
+            entry_type=dr.DeviceEntryType.SERVICE,
+        )
 
         # Add the entity to Home Assistant
-        from homeassistant.helpers.entity_component import EntityComponent
+        await hass.data[DATA_COMPONENT].async_add_entities([entity])
+        er.async_get(hass).async_update_entity(entity.entity_id, device_id=device.id)
 
-        component = EntityComponent(_LOGGER, DOMAIN, hass)
-        await component.async_add_entities([entity])
+        # Set up the completion sensors
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-        # Register service
-        async def handle_reset_now(call):
+        # Register service, shared by all entries
+        async def handle_reset_now(call: ServiceCall) -> None:
             """Handle the service call."""
-            await entity.async_reset_items()
+            entity_ids = call.data.get(CONF_ENTITY_ID)
+
+            for entry_data in list(hass.data.get(DOMAIN, {}).values()):
+                reset_entity = entry_data["entity"]
+                if entity_ids and reset_entity.entity_id not in entity_ids:
+                    continue
+                await reset_entity.async_reset_items()
+
+        if not hass.services.has_service(DOMAIN, SERVICE_RESET_NOW):
+            hass.services.async_register(
+                DOMAIN,
+                SERVICE_RESET_NOW,
+                handle_reset_now,
+                schema=RESET_NOW_SCHEMA,
+            )
 
-        hass.services.async_register(DOMAIN, "reset_now", handle_reset_now)
+        async def handle_get_completion_history(call: ServiceCall) -> ServiceResponse:
+            """Return completion aggregates of one reset list."""
+            history = _get_history(hass, call.data[CONF_ENTITY_ID])
+            return await history.async_query(
+                call.data.get("start"),
+                call.data.get("end"),
+                call.data.get("uid"),
+            )
+
+        if not hass.services.has_service(DOMAIN, SERVICE_GET_COMPLETION_HISTORY):
+            hass.services.async_register(
+                DOMAIN,
+                SERVICE_GET_COMPLETION_HISTORY,
+                handle_get_completion_history,
+                schema=GET_COMPLETION_HISTORY_SCHEMA,
+                supports_response=SupportsResponse.ONLY,
+            )
 
         # Set up update listener for config entry changes
         entry.async_on_unload(entry.add_update_listener(update_listener))
@@ -149,28 +249,140 @@ async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     try:
-        # Just remove the data
-        if DOMAIN in hass.data and entry.entry_id in hass.data[DOMAIN]:
-            del hass.data[DOMAIN][entry.entry_id]
+        if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+            return False
+
+        entry_data = hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+
+        # Remove the entity, this also cancels its reset timer, and through
+        # the component so its platform stops polling once it is empty
+        if entry_data is not None:
+            await hass.data[DATA_COMPONENT].async_remove_entity(
+                entry_data["entity"].entity_id
+            )
+
+        # The services go with the last entry
+        if not hass.data.get(DOMAIN):
+            hass.services.async_remove(DOMAIN, SERVICE_RESET_NOW)
+            hass.services.async_remove(DOMAIN, SERVICE_GET_COMPLETION_HISTORY)
 
         return True
-    except Exception as e:
+    except Exception:
+        _LOGGER.exception("Error unloading %s", entry.title)
         return False
 
 
-async def async_setup(hass: HomeAssistant, _config: ConfigType) -> bool:
+async def async_import_lists(hass: HomeAssistant, lists: list[dict[str, Any]]) -> None:
+    """Import reset lists from YAML as config entries, skipping known ones."""
+    configured = {
+        entry.unique_id for entry in hass.config_entries.async_entries(DOMAIN)
+    }
+
+    pending: dict[str, dict[str, Any]] = {}
+    for conf in lists:
+        data = {
+            **conf,
+            CONF_TIME: conf[CONF_TIME].strftime("%H:%M:%S"),
+        }
+        data.setdefault(
+            CONF_NAME,
+            data[CONF_ENTITY_ID].split(".")[-1].replace("_", " ").title(),
+        )
+
+        # Same unique ID as the config flow uses
+        unique_id = f"{data[CONF_ENTITY_ID]}_{data[CONF_TIME]}"
+        if unique_id in configured:
+            continue
+        if unique_id in pending:
+            _LOGGER.warning("Skipping duplicate reset list %s in YAML", unique_id)
+            continue
+        pending[unique_id] = data
+
+    if not pending:
+        return
+
+    _LOGGER.info("Importing %d reset list(s) from YAML", len(pending))
+
+    imports = list(pending.values())
+    for start in range(0, len(imports), IMPORT_BATCH_SIZE):
+        await asyncio.gather(
+            *(
+                hass.config_entries.flow.async_init(
+                    DOMAIN, context={"source": SOURCE_IMPORT}, data=data
+                )
+                for data in imports[start : start + IMPORT_BATCH_SIZE]
+            )
+        )
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the completion history of a removed entry."""
+    await TodoListHistory(hass, entry.entry_id).async_remove()
+
+
+def _get_history(hass: HomeAssistant, entity_id: str) -> TodoListHistory:
+    """Return the completion history of a reset list entity."""
+    for entry_data in hass.data.get(DOMAIN, {}).values():
+        if entry_data["entity"].entity_id == entity_id:
+            return entry_data["history"]
+
+    msg = f"{entity_id} is not a todo_list reset list"
+    raise ServiceValidationError(msg)
+
+
+async def _async_check_control(
+    hass: HomeAssistant, call: ServiceCall, entity_id: str
+) -> None:
+    """Raise unless the calling user may control an entity."""
+    if not call.context.user_id:
+        return
+
+    user = await hass.auth.async_get_user(call.context.user_id)
+    if user is None:
+        raise UnknownUser(context=call.context)
+    if not user.permissions.check_entity(entity_id, POLICY_CONTROL):
+        raise Unauthorized(
+            context=call.context, entity_id=entity_id, permission=POLICY_CONTROL
+        )
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Todo List integration."""
     try:
-        # Register frontend path
-        await hass.http.async_register_static_paths(
-            [
-                StaticPathConfig(
-                    url_path="/todo_list",
-                    path=hass.config.path("custom_components/todo_list/frontend"),
-                    cache_headers=False,
-                )
-            ]
+        # One component holds the reset entities of all entries
+        hass.data[DATA_COMPONENT] = EntityComponent(_LOGGER, DOMAIN, hass)
+
+        # Register frontend path and the content-hashed card assets
+        await TodoListCardRegistration(hass).async_register_todo_list_path()
+
+        # Register the batched card API
+        websocket_api.async_setup(hass)
+
+        async def handle_set_items_status(call: ServiceCall) -> ServiceResponse:
+            """Set the status of many items of a todo list at once."""
+            # The entity is called directly, check what todo.update_item would
+            await _async_check_control(hass, call, call.data[CONF_ENTITY_ID])
+
+            results = await async_set_items_status(
+                hass,
+                call.data[CONF_ENTITY_ID],
+                call.data["status"],
+                call.data.get("items"),
+                call.data.get("status_filter"),
+            )
+            return {"items": results}
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_SET_ITEMS_STATUS,
+            handle_set_items_status,
+            schema=SET_ITEMS_STATUS_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
         )
+
+        # Provision reset lists declared in YAML without holding up startup
+        if DOMAIN in config:
+            hass.async_create_task(async_import_lists(hass, config[DOMAIN]))
         return True
     except Exception as e:
         return False
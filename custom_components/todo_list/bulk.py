@@ -0,0 +1,101 @@
+"""Bulk item status changes on todo lists."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.todo import (
+    DOMAIN as TODO_DOMAIN,
+)
+from homeassistant.components.todo import (
+    TodoItemStatus,
+    TodoListEntityFeature,
+)
+from homeassistant.exceptions import ServiceValidationError
+
+from .concurrency import async_get_limiter
+
+if TYPE_CHECKING:
+    from homeassistant.components.todo import TodoItem, TodoListEntity
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_set_items_status(
+    hass: HomeAssistant,
+    source_entity_id: str,
+    status: str,
+    uids: list[str] | None = None,
+    status_filter: str | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Set the status of many items of a todo list in one batch.
+
+    Items are picked by UID or, without UIDs, by their current status.
+    Returns one result per picked item.
+    """
+    component = hass.data.get(TODO_DOMAIN)
+    source: TodoListEntity | None = (
+        component.get_entity(source_entity_id) if component else None
+    )
+    if source is None:
+        msg = f"{source_entity_id} is not a loaded todo list"
+        raise ServiceValidationError(msg)
+    if not (source.supported_features or 0) & TodoListEntityFeature.UPDATE_TODO_ITEM:
+        msg = f"{source_entity_id} does not support updates"
+        raise ServiceValidationError(msg)
+
+    items = {item.uid: item for item in source.todo_items or ()}
+    if uids is not None:
+        picked = {uid: items.get(uid) for uid in dict.fromkeys(uids)}
+    else:
+        picked = {
+            uid: item for uid, item in items.items() if item.status == status_filter
+        }
+
+    target = TodoItemStatus(status)
+    results: dict[str, dict[str, Any]] = {}
+    pending: list[TodoItem] = []
+
+    for uid, item in picked.items():
+        if item is None:
+            results[uid] = {"uid": uid, "result": "not_found"}
+        elif item.status == target:
+            results[uid] = {"uid": uid, "result": "unchanged"}
+        else:
+            pending.append(dataclasses.replace(item, status=target))
+
+    # Call the entity directly, one service call per item is what we avoid
+    limiter = async_get_limiter(hass, source_entity_id)
+    outcomes = await asyncio.gather(
+        *(
+            limiter.async_run(
+                lambda item=item: source.async_update_todo_item(item=item)
+            )
+            for item in pending
+        ),
+        return_exceptions=True,
+    )
+
+    for item, outcome in zip(pending, outcomes, strict=True):
+        if isinstance(outcome, Exception):
+            _LOGGER.warning(
+                "Unable to update %s on %s: %s", item.uid, source_entity_id, outcome
+            )
+            results[item.uid] = {
+                "uid": item.uid,
+                "result": "error",
+                "error": str(outcome),
+            }
+        else:
+            results[item.uid] = {"uid": item.uid, "result": "updated"}
+
+    # One state refresh for the whole batch
+    if pending:
+        source.async_write_ha_state()
+
+    return [results[uid] for uid in picked]
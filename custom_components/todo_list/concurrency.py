@@ -0,0 +1,122 @@
+"""Adaptive concurrency for item updates against todo list providers."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, TypeVar
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    ADAPTIVE_LATENCY_TOLERANCE,
+    ADAPTIVE_MAX_CONCURRENCY,
+    DATA_LIMITERS,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+_T = TypeVar("_T")
+
+# Weight of the newest sample in the smoothed latency
+_LATENCY_SMOOTHING = 0.2
+
+# The baseline creeps up slowly so a provider that got slower for good
+# does not keep the limit pinned down forever
+_BASELINE_DRIFT = 1.01
+
+
+@callback
+def async_get_limiter(
+    hass: HomeAssistant, source_entity_id: str
+) -> AdaptiveConcurrencyLimiter:
+    """Return the limiter learned for a source todo entity."""
+    limiters = hass.data.setdefault(DATA_LIMITERS, {})
+    if source_entity_id not in limiters:
+        limiters[source_entity_id] = AdaptiveConcurrencyLimiter()
+    return limiters[source_entity_id]
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Additive-increase, multiplicative-decrease limit on parallel calls.
+
+    The limit grows by roughly one per fully used window of calls while
+    latency stays near the best seen so far, and halves on an error or when
+    the smoothed latency exceeds that baseline by ADAPTIVE_LATENCY_TOLERANCE.
+    """
+
+    def __init__(
+        self,
+        min_limit: int = 1,
+        max_limit: int = ADAPTIVE_MAX_CONCURRENCY,
+    ) -> None:
+        """Initialize the limiter, starting with sequential calls."""
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._limit = float(min_limit)
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+        self._baseline: float | None = None
+        self._latency: float | None = None
+        self._last_decrease = 0.0
+        self._last_saturated = 0.0
+
+    @property
+    def limit(self) -> int:
+        """Return the number of calls currently allowed in parallel."""
+        return max(self._min_limit, int(self._limit))
+
+    @property
+    def latency(self) -> float | None:
+        """Return the smoothed call latency in seconds."""
+        return self._latency
+
+    async def async_run(self, func: Callable[[], Awaitable[_T]]) -> _T:
+        """Run a call once a slot is free and learn from how it went."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+        started = time.monotonic()
+        if self._in_flight >= self.limit:
+            self._last_saturated = started
+        try:
+            result = await func()
+        except Exception:
+            self._decrease(started)
+            raise
+        else:
+            self._record(started, time.monotonic() - started)
+            return result
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def _record(self, started: float, latency: float) -> None:
+        """Adjust the limit after a successful call."""
+        if self._baseline is None:
+            self._baseline = latency
+        else:
+            self._baseline = min(latency, self._baseline * _BASELINE_DRIFT)
+
+        if self._latency is None:
+            self._latency = latency
+        else:
+            self._latency += _LATENCY_SMOOTHING * (latency - self._latency)
+
+        if self._latency > self._baseline * ADAPTIVE_LATENCY_TOLERANCE:
+            self._decrease(started)
+        elif self._last_saturated >= started:
+            # Only grow when the current limit was used while this call ran,
+            # every call of a full window then adds its share
+            self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+
+    def _decrease(self, started: float) -> None:
+        """Halve the limit, once per window of calls in flight together."""
+        if started < self._last_decrease:
+            return
+        self._last_decrease = time.monotonic()
+        self._limit = max(self._min_limit, self._limit / 2)
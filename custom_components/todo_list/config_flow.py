@@ -87,6 +87,20 @@ class TodoResetConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             ),
         )
 
+    async def async_step_import(self, import_data: dict[str, Any]) -> FlowResult:
+        """Create an entry for a reset list declared in YAML."""
+        await self.async_set_unique_id(
+            f"{import_data[CONF_ENTITY_ID]}_{import_data[CONF_TIME]}"
+        )
+        self._abort_if_unique_id_configured()
+        return cast(
+            FlowResult,
+            self.async_create_entry(
+                title=import_data[CONF_NAME],
+                data=import_data,
+            ),
+        )
+
     # Add options flow handler
     @staticmethod
     def async_get_options_flow(
@@ -6,6 +6,16 @@ DOMAIN = "todo_list"
 CONF_TIME = "reset_time"
 DEFAULT_TIME = "00:00:00"
 URL_BASE = "/todo_list"
+SERVICE_RESET_NOW = "reset_now"
+SERVICE_GET_COMPLETION_HISTORY = "get_completion_history"
+SERVICE_SET_ITEMS_STATUS = "set_items_status"
+
+# Bus events fired around every reset, also exposed as device triggers
+EVENT_RESET_STARTED = f"{DOMAIN}_reset_started"
+EVENT_RESET_COMPLETED = f"{DOMAIN}_reset_completed"
+
+# hass.data key holding the EntityComponent shared by all reset entities
+DATA_COMPONENT = f"{DOMAIN}_component"
 
 # New constants for UI display settings
 CONF_DISPLAY_POSITION = "display_position"
@@ -13,6 +23,26 @@ CONF_DISPLAY_HOURS = "display_hours"
 DEFAULT_DISPLAY_POSITION = "before"
 DEFAULT_DISPLAY_HOURS = 2
 
-TODO_LIST_CARDS = [
-    {"name": "Todo List Cards", "filename": "todo-reset-card.js", "version": "0.0.6"}
-]
+# Seconds a reset may run before its transient "resetting" state is published
+RESETTING_PUBLISH_DELAY = 1.0
+
+# Minimum seconds between completion sensor state writes
+SENSOR_UPDATE_COOLDOWN = 5.0
+
+# Number of YAML reset lists imported as config entries at once
+IMPORT_BATCH_SIZE = 20
+
+# Upper bound for parallel item updates against one source list
+ADAPTIVE_MAX_CONCURRENCY = 8
+
+# Back off once smoothed latency exceeds the best seen by this factor
+ADAPTIVE_LATENCY_TOLERANCE = 2.0
+
+# hass.data key holding the concurrency limiter of each source list
+DATA_LIMITERS = f"{DOMAIN}_limiters"
+
+# Cards are served from content-hashed URLs, see frontend/__init__.py
+TODO_LIST_CARDS = [{"name": "Todo List Cards", "filename": "todo-reset-card.js"}]
+
+# hass.data key holding the hashed URL of each card by filename
+DATA_CARD_URLS = f"{DOMAIN}_card_urls"
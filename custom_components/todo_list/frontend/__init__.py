@@ -1,123 +1,219 @@
 """Frontend for Todo List Cards."""
 
+import gzip
+import hashlib
 import logging
-import os
 import pathlib
+import re
 
-from homeassistant.components.http import StaticPathConfig
-from homeassistant.core import HomeAssistant
+from aiohttp import hdrs, web
+from homeassistant.components.http import HomeAssistantView, StaticPathConfig
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
 
-from ..const import TODO_LIST_CARDS, URL_BASE
+from ..const import DATA_CARD_URLS, TODO_LIST_CARDS, URL_BASE
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 _LOGGER = logging.getLogger(__name__)
 
+FRONTEND_PATH = pathlib.Path(__file__).parent
+DIST_PATH = FRONTEND_PATH / "dist"
+DIST_URL = f"{URL_BASE}/dist"
+
+# Hashed assets never change under the same URL
+IMMUTABLE_CACHE_HEADERS = {hdrs.CACHE_CONTROL: "public, max-age=31536000, immutable"}
+
+
+def minify_js(source: str) -> str:
+    """
+    Strip indentation, blank lines and full-line comments.
+
+    Deliberately conservative: line breaks are kept so automatic semicolon
+    insertion behaves exactly as in the source.
+    """
+    lines = []
+    for line in source.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("//"):
+            continue
+        lines.append(stripped)
+    return "\n".join(lines) + "\n"
+
+
+def build_card_assets(filename: str) -> str:
+    """
+    Write minified, precompressed and content-hashed copies of a card.
+
+    Returns the hashed filename. Runs in the executor.
+    """
+    source = FRONTEND_PATH / filename
+    minified = minify_js(source.read_text(encoding="utf-8")).encode()
+    digest = hashlib.sha256(minified).hexdigest()[:12]
+    hashed_name = f"{source.stem}.{digest}{source.suffix}"
+    target = DIST_PATH / hashed_name
+
+    if target.exists():
+        return hashed_name
+
+    DIST_PATH.mkdir(exist_ok=True)
+
+    # Drop earlier builds of this card
+    for old in DIST_PATH.glob(f"{source.stem}.*"):
+        old.unlink()
+
+    # Compressed siblings are picked up by aiohttp based on Accept-Encoding
+    (DIST_PATH / f"{hashed_name}.gz").write_bytes(
+        gzip.compress(minified, compresslevel=9, mtime=0)
+    )
+    if brotli is not None:
+        (DIST_PATH / f"{hashed_name}.br").write_bytes(brotli.compress(minified))
+    target.write_bytes(minified)
+
+    return hashed_name
+
+
+class TodoListCardView(HomeAssistantView):
+    """Serve a content-hashed card with immutable cache headers."""
+
+    requires_auth = False
+
+    def __init__(self, url: str, path: pathlib.Path) -> None:
+        """Initialize the view for one card file."""
+        self.url = url
+        self.name = f"todo_list:card:{path.name}"
+        self._path = path
+
+    async def get(self, _request: web.Request) -> web.FileResponse:
+        """Return the card file."""
+        return web.FileResponse(self._path, headers=IMMUTABLE_CACHE_HEADERS)
+
 
 class TodoListCardRegistration:
     def __init__(self, hass: HomeAssistant):
         self.hass = hass
+        self._retry_unsub = None
 
     async def async_register(self):
-        await self.async_register_todo_list_path()
         if self.hass.data["lovelace"]["mode"] == "storage":
             await self.async_wait_for_lovelace_resources()
 
     # install card
     async def async_register_todo_list_path(self):
-        """Register custom cards path if not already registered"""
+        """Register the cards path and the hashed card assets once."""
         try:
             await self.hass.http.async_register_static_paths(
-                [StaticPathConfig(URL_BASE, pathlib.Path(__file__).parent, False)]
-            )
-            _LOGGER.debug(
-                "Registered Todo List path from %s", pathlib.Path(__file__).parent
+                [StaticPathConfig(URL_BASE, str(FRONTEND_PATH), False)]
             )
+            _LOGGER.debug("Registered Todo List path from %s", FRONTEND_PATH)
         except RuntimeError:
             _LOGGER.debug("Todo List static path already registered")
 
+        if DATA_CARD_URLS in self.hass.data:
+            return
+
+        card_urls = {}
+        for card in TODO_LIST_CARDS:
+            filename = card.get("filename")
+            try:
+                hashed_name = await self.hass.async_add_executor_job(
+                    build_card_assets, filename
+                )
+            except OSError as err:
+                # Fall back to the uncached source file
+                _LOGGER.warning("Unable to build %s: %s", filename, err)
+                card_urls[filename] = f"{URL_BASE}/{filename}"
+                continue
+
+            url = f"{DIST_URL}/{hashed_name}"
+            self.hass.http.register_view(TodoListCardView(url, DIST_PATH / hashed_name))
+            card_urls[filename] = url
+            _LOGGER.debug("Serving %s from %s", card.get("name"), url)
+
+        self.hass.data[DATA_CARD_URLS] = card_urls
+
     async def async_wait_for_lovelace_resources(self) -> None:
         async def check_lovelace_resources_loaded(now):
+            self._retry_unsub = None
             if self.hass.data["lovelace"]["resources"].loaded:
                 await self.async_register_todo_list_cards()
             else:
                 _LOGGER.debug(
                     "Unable to install Todo List Cards because Lovelace resources not yet loaded. Trying again in 5 seconds"
                 )
-                async_call_later(self.hass, 5, check_lovelace_resources_loaded)
+                self._retry_unsub = async_call_later(
+                    self.hass, 5, check_lovelace_resources_loaded
+                )
 
         await check_lovelace_resources_loaded(0)
 
+    @callback
+    def async_cancel(self) -> None:
+        """Stop waiting for Lovelace resources."""
+        if self._retry_unsub is not None:
+            self._retry_unsub()
+            self._retry_unsub = None
+
     async def async_register_todo_list_cards(self):
         _LOGGER.debug("Installing Lovelace resource for Todo List Cards")
 
-        # Get resources already registered
-        todo_list_resources = [
-            resource
-            for resource in self.hass.data["lovelace"]["resources"].async_items()
-            if resource["url"].startswith(URL_BASE)
-        ]
+        resources = self.hass.data["lovelace"]["resources"]
+        card_urls = self.hass.data.get(DATA_CARD_URLS, {})
 
         for card in TODO_LIST_CARDS:
-            url = f"{URL_BASE}/{card.get('filename')}"
-
-            card_registered = False
-
-            for res in todo_list_resources:
-                if self.get_resource_path(res["url"]) == url:
-                    card_registered = True
-                    # check version
-                    if self.get_resource_version(res["url"]) != card.get("version"):
-                        # Update card version
-                        _LOGGER.debug(
-                            "Updating %s to version %s",
-                            card.get("name"),
-                            card.get("version"),
-                        )
-                        await self.hass.data["lovelace"]["resources"].async_update_item(
-                            res.get("id"),
-                            {
-                                "res_type": "module",
-                                "url": url + "?v=" + card.get("version"),
-                            },
-                        )
-
-                    else:
-                        _LOGGER.debug(
-                            "%s already registered as version %s",
-                            card.get("name"),
-                            card.get("version"),
-                        )
-
-            if not card_registered:
-                _LOGGER.debug(
-                    "Registering %s as version %s",
-                    card.get("name"),
-                    card.get("version"),
-                )
-                await self.hass.data["lovelace"]["resources"].async_create_item(
-                    {"res_type": "module", "url": url + "?v=" + card.get("version")}
+            filename = card.get("filename")
+            url = card_urls.get(filename, f"{URL_BASE}/{filename}")
+
+            # Any earlier version of this card, hashed or not
+            card_resources = [
+                resource
+                for resource in resources.async_items()
+                if self.is_card_resource(resource["url"], filename)
+            ]
+
+            if not card_resources:
+                _LOGGER.debug("Registering %s as %s", card.get("name"), url)
+                await resources.async_create_item({"res_type": "module", "url": url})
+                continue
+
+            current, *duplicates = card_resources
+
+            if current["url"] != url:
+                # Keep the resource in sync with the current content hash
+                _LOGGER.debug("Updating %s to %s", card.get("name"), url)
+                await resources.async_update_item(
+                    current.get("id"), {"res_type": "module", "url": url}
                 )
+            else:
+                _LOGGER.debug("%s already registered as %s", card.get("name"), url)
+
+            for resource in duplicates:
+                await resources.async_delete_item(resource.get("id"))
 
     def get_resource_path(self, url: str):
         return url.split("?")[0]
 
-    def get_resource_version(self, url: str):
-        try:
-            return url.split("?")[1].replace("v=", "")
-        except Exception:
-            return 0
+    def is_card_resource(self, url: str, filename: str) -> bool:
+        """Return whether a resource URL points at any build of a card."""
+        stem, suffix = filename.rsplit(".", 1)
+        pattern = (
+            rf"{re.escape(URL_BASE)}/(dist/)?{re.escape(stem)}(\.[0-9a-f]+)?\.{suffix}"
+        )
+        return re.fullmatch(pattern, self.get_resource_path(url)) is not None
 
     async def async_unregister(self):
         # Unload lovelace module resource
         if self.hass.data["lovelace"]["mode"] == "storage":
             for card in TODO_LIST_CARDS:
-                url = f"{URL_BASE}/{card.get('filename')}"
                 todo_list_resources = [
                     resource
                     for resource in self.hass.data["lovelace"][
                         "resources"
                     ].async_items()
-                    if str(resource["url"]).startswith(url)
+                    if self.is_card_resource(str(resource["url"]), card["filename"])
                 ]
 
                 for resource in todo_list_resources:
@@ -6,13 +6,25 @@ const DEBUG = false; // Set to true to enable debug logging
 const CSS_CLASSES = {
   DONE: "done",
   ERROR: "error",
+  LOADING: "loading",
   TODO_ITEM: "todo-item",
   TODO_LIST: "todo-list",
   CARD_HEADER: "card-header",
   CARD_CONTENT: "card-content",
-  CARD_ACTIONS: "card-actions"
+  CARD_ACTIONS: "card-actions",
+  RESET_BUTTON: "reset-button",
+  SELECT_BUTTON: "select-button",
+  SELECT_ACTIONS: "select-actions",
+  SELECTED: "selected",
+  SELECTING: "selecting"
 };
 
+// Offline item cache, lets a cold dashboard paint before the websocket answers
+const CACHE_PREFIX = "todo_list_cache:";
+const CACHE_INDEX_KEY = "todo_list_cache_index";
+const CACHE_MAX_LISTS = 20;
+const CACHE_MAX_BYTES = 64 * 1024;
+
 // Helper function for conditional logging
 const debugLog = (...args) => {
   if (DEBUG) {
@@ -32,12 +44,30 @@ if (customElements.get("todo-reset-card")) {
 
     set hass(hass) {
       this._hass = hass;
+
+      // Once built, only the form needs the new hass, rebuilding would
+      // drop focus and flicker on every state change
+      if (this._haForm) {
+        this._haForm.hass = hass;
+        return;
+      }
       this._render();
     }
 
     setConfig(config) {
-      this.config = config || {};
-      this._render();
+      const newConfig = config || {};
+      const changed = !this.config || this.config.entity !== newConfig.entity;
+      this.config = newConfig;
+
+      if (!this._haForm) {
+        this._render();
+        return;
+      }
+
+      // Only touch the form when the config actually changed
+      if (changed) {
+        this._haForm.data = this.config;
+      }
     }
 
     configChanged(newConfig) {
@@ -64,7 +94,7 @@ if (customElements.get("todo-reset-card")) {
     }
 
     _render() {
-      if (!this._hass) return;
+      if (!this._hass || !this.config) return;
       this._clearShadowRoot();
       this._createForm();
     }
@@ -86,6 +116,7 @@ if (customElements.get("todo-reset-card")) {
       container.className = 'card-config';
 
       const haForm = this._createHaForm();
+      this._haForm = haForm;
       container.appendChild(haForm);
       this.shadowRoot.appendChild(container);
     }
@@ -165,115 +196,245 @@ if (customElements.get("todo-reset-card")) {
     }
 
     disconnectedCallback() {
-      const haForm = this.shadowRoot.querySelector('ha-form');
-      if (haForm) {
-        haForm.removeEventListener('value-changed', this._boundValueChanged);
+      if (this._haForm) {
+        this._haForm.removeEventListener('value-changed', this._boundValueChanged);
+        this._haForm = null;
+      }
+      this._clearShadowRoot();
+    }
+
+    connectedCallback() {
+      // Rebuild after being detached, e.g. when the dialog is reopened
+      if (!this._haForm) {
+        this._render();
       }
     }
   }
 
   customElements.define("todo-reset-card-editor", TodoResetCardEditor);
 
-  class TodoResetCard extends HTMLElement {
+  // Shared by every card on the page so a dashboard holds one subscription
+  // for all reset entities instead of one request per card
+  class TodoListDataSource {
     constructor() {
-      super();
-      this._config = {};
-      this._initialized = false;
-      this._items = [];
-      this._boundHandleReset = this._handleReset.bind(this);
-      this._boundRefreshVisibility = this._refreshVisibility.bind(this);
-      this.attachShadow({ mode: "open" });
+      this._hass = null;
+      this._listeners = new Map(); // entity_id -> Set of callbacks
+      this._entries = new Map(); // entity_id -> last received entry
+      this._unsub = null;
+      this._pending = null;
+      this._updating = Promise.resolve();
     }
 
-    static getConfigElement() {
-      return document.createElement("todo-reset-card-editor");
-    }
+    subscribe(hass, entityId, callback) {
+      this._hass = hass;
 
-    static getStubConfig() {
-      return {
-        entity: ""
+      let callbacks = this._listeners.get(entityId);
+      if (!callbacks) {
+        callbacks = new Set();
+        this._listeners.set(entityId, callbacks);
+        this._scheduleResubscribe();
+      }
+      callbacks.add(callback);
+
+      // Serve what we already have straight away
+      if (this._entries.has(entityId)) {
+        callback(this._entries.get(entityId));
+      }
+
+      return () => {
+        callbacks.delete(callback);
+        if (!callbacks.size) {
+          this._listeners.delete(entityId);
+          this._entries.delete(entityId);
+          this._scheduleResubscribe();
+        }
       };
     }
 
-    set hass(hass) {
-      const oldHass = this._hass;
-      this._hass = hass;
+    getEntry(entityId) {
+      return this._entries.get(entityId);
+    }
 
-      // If this is the first time we're getting hass, subscribe to events
-      if (!oldHass && hass) {
-        this._subscribeToEvents();
+    _scheduleResubscribe() {
+      // Cards connect in a burst on load, gather them into one message
+      if (this._pending) return;
+      this._pending = setTimeout(() => {
+        this._pending = null;
+        this._resubscribe();
+      }, 0);
+    }
+
+    _resubscribe() {
+      // One resubscribe at a time, an overlapping one would not see the
+      // subscription still being set up and leave it open on the server
+      this._updating = this._updating.then(() => this._replaceSubscription());
+      return this._updating;
+    }
+
+    async _replaceSubscription() {
+      const oldUnsub = this._unsub;
+      this._unsub = null;
+
+      const entityIds = [...this._listeners.keys()];
+      if (this._hass && entityIds.length) {
+        try {
+          this._unsub = await this._hass.connection.subscribeMessage(
+            (message) => this._handleMessage(message),
+            { type: "todo_list/items/subscribe", entity_ids: entityIds }
+          );
+        } catch (error) {
+          console.error("Failed to subscribe to todo_list items:", error);
+        }
       }
 
-      this.updateCard();
+      if (oldUnsub) {
+        oldUnsub();
+      }
     }
 
-    _checkTimeBasedVisibility() {
-      // Only check visibility once per minute to avoid excessive updates
-      const now = Date.now();
-      if (now - this._lastVisibilityCheck < 60000) { // 60000ms = 1 minute
-        return;
+    _handleMessage(message) {
+      for (const entry of message.entries || []) {
+        const callbacks = this._listeners.get(entry.entity_id);
+        if (!callbacks) continue;
+        this._entries.set(entry.entity_id, entry);
+        callbacks.forEach(callback => callback(entry));
       }
+    }
+  }
 
-      this._lastVisibilityCheck = now;
-      console.log("Time-based visibility check triggered");
+  const todoListDataSource = new TodoListDataSource();
 
-      if (this._hass && this._config && this._config.entity) {
-        const resetEntity = this._hass.states[this._config.entity];
-        if (resetEntity) {
-          // Check if visibility should change
-          const shouldShow = this._shouldShowCard(resetEntity);
+  // Last-known items per source list in localStorage, capped in number of
+  // lists and size per list, least recently written lists are evicted first
+  class TodoListItemCache {
+    constructor() {
+      this._written = new Map(); // reset entity -> last serialized items
+    }
 
-          // Update visibility if needed
-          if (shouldShow && this.style.display === 'none') {
-            console.log("Time check: Showing card");
-            this.style.display = 'block';
-          } else if (!shouldShow && this.style.display !== 'none') {
-            console.log("Time check: Hiding card");
-            this.style.display = 'none';
-          }
-        }
+    getForEntity(resetEntityId) {
+      // Several reset lists can share one source list, and so its cache
+      const index = this._readIndex();
+      const sourceEntityId = Object.keys(index)
+        .find(source => this._entities(index[source]).includes(resetEntityId));
+      if (!sourceEntityId) return null;
+
+      try {
+        const raw = localStorage.getItem(CACHE_PREFIX + sourceEntityId);
+        return raw ? JSON.parse(raw) : null;
+      } catch (error) {
+        debugLog("Unable to read cached items:", error);
+        return null;
       }
     }
 
-    async fetchItems() {
-      if (!this._hass || !this._config || !this._config.entity) {
-        console.error("Missing hass or config for fetchItems");
-        return [];
+    set(sourceEntityId, resetEntityId, items) {
+      const raw = JSON.stringify(items);
+
+      // Nothing changed since the last write, spare the storage
+      if (this._written.get(resetEntityId) === raw) return;
+      this._written.set(resetEntityId, raw);
+
+      const index = this._readIndex();
+      if (raw.length > CACHE_MAX_BYTES) {
+        this._remove(index, sourceEntityId);
+        this._writeIndex(index);
+        return;
       }
 
-      // Get the source entity ID from our entity's attributes
-      const resetEntity = this._hass.states[this._config.entity];
-      if (!resetEntity) {
-        console.error(`Entity ${this._config.entity} not found`);
-        return [];
+      const entities = this._entities(index[sourceEntityId]);
+      index[sourceEntityId] = {
+        entities: entities.includes(resetEntityId) ? entities : [...entities, resetEntityId],
+        updated: Date.now()
+      };
+      const sources = Object.keys(index)
+        .sort((a, b) => index[a].updated - index[b].updated);
+      while (sources.length > CACHE_MAX_LISTS) {
+        this._remove(index, sources.shift());
       }
 
-      if (!resetEntity.attributes || !resetEntity.attributes.source_entity_id) {
-        console.error(`Source entity ID not found in attributes for ${this._config.entity}`);
-        console.log("Available attributes:", resetEntity.attributes);
-        return [];
+      try {
+        localStorage.setItem(CACHE_PREFIX + sourceEntityId, raw);
+      } catch (error) {
+        // Storage full, give the space back rather than keep a partial cache
+        debugLog("Unable to cache items:", error);
+        this._remove(index, sourceEntityId);
       }
+      this._writeIndex(index);
+    }
 
-      const sourceEntityId = resetEntity.attributes.source_entity_id;
-      console.log(`Fetching items for source entity: ${sourceEntityId}`);
+    _entities(record) {
+      // Indexes written before lists could share a source hold one entity
+      if (!record) return [];
+      return record.entities || (record.entity ? [record.entity] : []);
+    }
 
+    _remove(index, sourceEntityId) {
+      delete index[sourceEntityId];
       try {
-        const result = await this._hass.callWS({
-          type: "todo/item/list",
-          entity_id: sourceEntityId,
-        });
+        localStorage.removeItem(CACHE_PREFIX + sourceEntityId);
+      } catch (error) {
+        debugLog("Unable to evict cached items:", error);
+      }
+    }
 
-        if (!result || !result.items) {
-          console.error("No items returned from todo/item/list call");
-          return [];
-        }
+    _readIndex() {
+      try {
+        return JSON.parse(localStorage.getItem(CACHE_INDEX_KEY)) || {};
+      } catch (error) {
+        return {};
+      }
+    }
 
-        console.log(`Retrieved ${result.items.length} items from ${sourceEntityId}`);
-        return result.items;
+    _writeIndex(index) {
+      try {
+        localStorage.setItem(CACHE_INDEX_KEY, JSON.stringify(index));
       } catch (error) {
-        console.error(`Error fetching todo items for ${sourceEntityId}:`, error);
-        return [];
+        debugLog("Unable to write item cache index:", error);
+      }
+    }
+  }
+
+  const todoListItemCache = new TodoListItemCache();
+
+  class TodoResetCard extends HTMLElement {
+    constructor() {
+      super();
+      this._config = {};
+      this._initialized = false;
+      this._items = [];
+      this._dataUnsub = null;
+      this._dataEntity = null;
+      this._live = false;
+      this._selecting = false;
+      this._selected = new Set();
+      this._boundToggleSelectMode = this._toggleSelectMode.bind(this);
+      this._boundHandleBulkAction = this._handleBulkAction.bind(this);
+      this._boundHandleEntry = this._handleEntry.bind(this);
+      this._boundHandleReset = this._handleReset.bind(this);
+      this._boundRefreshVisibility = this._refreshVisibility.bind(this);
+      this.attachShadow({ mode: "open" });
+    }
+
+    static getConfigElement() {
+      return document.createElement("todo-reset-card-editor");
+    }
+
+    static getStubConfig() {
+      return {
+        entity: ""
+      };
+    }
+
+    set hass(hass) {
+      const oldHass = this._hass;
+      this._hass = hass;
+
+      // If this is the first time we're getting hass, subscribe to events
+      if (!oldHass && hass) {
+        this._subscribeToEvents();
       }
+
+      this.updateCard();
     }
 
     async updateCard() {
@@ -293,13 +454,16 @@ if (customElements.get("todo-reset-card")) {
       console.log("Reset entity state:", resetEntity.state);
       console.log("Reset entity attributes:", resetEntity.attributes);
 
-      // Handle unavailable entity state
-      if (resetEntity.state === "unavailable") {
-        return this._showError(`Entity ${this._config.entity} is currently unavailable. This may be because Home Assistant is still starting up or the entity has an error.`);
+      // Still starting up, the entity restores its last state once loaded.
+      // Subscribe now so items arrive as soon as it is there.
+      if (resetEntity.state === "unavailable" || resetEntity.attributes.restored) {
+        this._subscribeToItems();
+        this._paintFromCache();
+        return this._showLoading();
       }
 
       // Check if the card should be visible based on time settings
-      if (!this._shouldShowCard(resetEntity)) {
+      if (!this._shouldShowCard()) {
         this.style.display = 'none';
         return;
       } else {
@@ -314,79 +478,83 @@ if (customElements.get("todo-reset-card")) {
           `Available attributes: ${Object.keys(resetEntity.attributes).join(', ')}` :
           'No attributes found';
 
-        // Special message for restored entities
-        if (resetEntity.attributes.restored) {
-          return this._showError(`Entity ${this._config.entity} has been restored but not fully initialized. Please check your configuration or restart Home Assistant.`);
-        }
-
         return this._showError(`Source entity not defined in ${this._config.entity}. ${attrs}`);
       }
 
       // Update header
       this._updateHeader(sourceEntityId);
 
-      // Fetch and render items
-      try {
-        const items = await this.fetchItems();
-        this._renderTodoList(items);
-      } catch (error) {
-        console.error("Error updating todo list:", error);
-        this._showError(`Error loading items: ${error.message}`);
+      // Render from the shared subscription, items stream in as they change
+      this._subscribeToItems();
+      const entry = todoListDataSource.getEntry(this._config.entity);
+      if (entry) {
+        this._handleEntry(entry);
+      } else {
+        this._paintFromCache();
       }
     }
 
-    _shouldShowCard(resetEntity) {
-      // Get display settings from entity attributes
-      const displayPosition = resetEntity.attributes.display_position || 'before';
-      const displayHours = parseInt(resetEntity.attributes.display_hours) || 2;
-      const resetTime = resetEntity.attributes.reset_time || '00:00:00';
+    _paintFromCache() {
+      // Stale items until the subscription delivers fresh ones
+      if (this._live) return;
 
-      // Parse reset time
-      const [resetHour, resetMinute, resetSecond] = resetTime.split(':').map(Number);
-
-      // Get current time
-      const now = new Date();
+      const cached = todoListItemCache.getForEntity(this._config.entity);
+      if (cached) {
+        this._items = cached;
+        this._renderTodoList(this._items);
+      }
+    }
 
-      // Create Date objects for comparison
-      const resetDate = new Date();
-      resetDate.setHours(resetHour, resetMinute, resetSecond, 0);
+    _subscribeToItems() {
+      if (this._dataUnsub && this._dataEntity === this._config.entity) return;
 
-      // Calculate time difference in hours (precise)
-      const diffMs = Math.abs(now - resetDate);
-      const diffHours = diffMs / (1000 * 60 * 60);
+      this._unsubscribeFromItems();
+      this._dataEntity = this._config.entity;
+      this._dataUnsub = todoListDataSource.subscribe(
+        this._hass, this._config.entity, this._boundHandleEntry
+      );
+    }
 
-      // Determine if we should show the card based on position and hours
-      if (displayPosition === 'before') {
-        if (now < resetDate) {
-          // We're before the reset time today
-          return diffHours <= displayHours;
-        } else {
-          // We're after the reset time, check against tomorrow's reset
-          const tomorrowResetDate = new Date(resetDate);
-          tomorrowResetDate.setDate(tomorrowResetDate.getDate() + 1);
+    _unsubscribeFromItems() {
+      if (this._dataUnsub) {
+        this._dataUnsub();
+        this._dataUnsub = null;
+        this._dataEntity = null;
+      }
+    }
 
-          const diffToTomorrowMs = tomorrowResetDate - now;
-          const hoursUntilTomorrow = diffToTomorrowMs / (1000 * 60 * 60);
-          const hoursInDay = 24;
+    _handleEntry(entry) {
+      const resetEntity = this._hass?.states[this._config.entity];
+      if (entry.error && (!resetEntity || resetEntity.state === "unavailable")) {
+        return this._showLoading();
+      }
+      if (entry.error) {
+        return this._showError(`Entity ${entry.entity_id} not found`);
+      }
+      if (!entry.items) {
+        return this._showError(`Source entity ${entry.config.source_entity_id} is not loaded yet`);
+      }
 
-          // We should NOT show if we're within displayHours of tomorrow's reset
-          return hoursUntilTomorrow >= (hoursInDay - displayHours);
-        }
-      } else { // 'after'
-        if (now >= resetDate) {
-          // We're after the reset time today
-          return diffHours <= displayHours;
-        } else {
-          // We're before the reset time, check against yesterday's reset
-          const yesterdayResetDate = new Date(resetDate);
-          yesterdayResetDate.setDate(yesterdayResetDate.getDate() - 1);
-
-          const diffFromYesterdayMs = now - yesterdayResetDate;
-          const hoursSinceYesterday = diffFromYesterdayMs / (1000 * 60 * 60);
-
-          return hoursSinceYesterday <= displayHours;
-        }
+      if (!this._shouldShowCard()) {
+        this.style.display = 'none';
+        return;
       }
+      this.style.display = 'block';
+
+      this._live = true;
+      this._items = entry.items;
+      this._renderTodoList(this._items);
+      todoListItemCache.set(entry.config.source_entity_id, this._config.entity, entry.items);
+    }
+
+    _shouldShowCard() {
+      // The window comes from the server, worked out from the reset entity's
+      // settings. Show the card until the first entry has arrived.
+      const visibility = todoListDataSource.getEntry(this._config.entity)?.visibility;
+      if (!visibility) return true;
+
+      const now = Date.now();
+      return now >= Date.parse(visibility.start) && now < Date.parse(visibility.end);
     }
 
     _updateHeader(sourceEntityId) {
@@ -416,6 +584,11 @@ if (customElements.get("todo-reset-card")) {
           const item = items.find(i => i.uid === itemId);
           if (!item) return;
 
+          if (this._selecting) {
+            this._toggleSelected(element, itemId);
+            return;
+          }
+
           await this._toggleItemStatus(item);
         };
       });
@@ -437,11 +610,58 @@ if (customElements.get("todo-reset-card")) {
       this.updateCard();
     }
 
+    _toggleSelectMode() {
+      this._selecting = !this._selecting;
+      this._selected.clear();
+
+      const card = this.shadowRoot.querySelector("ha-card");
+      card?.classList.toggle(CSS_CLASSES.SELECTING, this._selecting);
+
+      const selectButton = this.shadowRoot.querySelector(`.${CSS_CLASSES.SELECT_BUTTON}`);
+      if (selectButton) {
+        selectButton.textContent = this._selecting ? "Cancel" : "Select";
+      }
+
+      this._renderTodoList(this._items);
+    }
+
+    _toggleSelected(element, itemId) {
+      if (this._selected.has(itemId)) {
+        this._selected.delete(itemId);
+      } else {
+        this._selected.add(itemId);
+      }
+      element.classList.toggle(CSS_CLASSES.SELECTED, this._selected.has(itemId));
+    }
+
+    async _handleBulkAction(event) {
+      const sourceEntityId = this._getSourceEntityId();
+      const status = event.currentTarget.dataset.status;
+      if (!sourceEntityId || !this._selected.size) return;
+
+      // One request for the whole selection instead of one per item
+      try {
+        await this._hass.callService("todo_list", "set_items_status", {
+          entity_id: sourceEntityId,
+          items: [...this._selected],
+          status: status,
+        });
+      } catch (error) {
+        console.error("Error updating selected items:", error);
+        this._showError(`Failed to update items: ${error.message}`);
+        return;
+      }
+
+      this._toggleSelectMode();
+    }
+
     async _handleReset() {
       if (!this._hass || !this._config?.entity) return;
 
       try {
-        await this._hass.callService("todo_list", "reset_now", {});
+        await this._hass.callService("todo_list", "reset_now", {
+          entity_id: this._config.entity,
+        });
 
         // Show a temporary "resetting" state
         const header = this.shadowRoot.querySelector(`.${CSS_CLASSES.CARD_HEADER}`);
@@ -471,6 +691,7 @@ if (customElements.get("todo-reset-card")) {
       this._config = config;
 
       this._initialized = false;
+      this._live = false;
       this.updateCard();
     }
 
@@ -481,6 +702,11 @@ if (customElements.get("todo-reset-card")) {
     _getSourceEntityId() {
       if (!this._hass || !this._config?.entity) return null;
 
+      const entry = todoListDataSource.getEntry(this._config.entity);
+      if (entry?.config?.source_entity_id) {
+        return entry.config.source_entity_id;
+      }
+
       const resetEntity = this._hass.states[this._config.entity];
       if (!resetEntity) return null;
 
@@ -507,6 +733,16 @@ if (customElements.get("todo-reset-card")) {
         .replace(/\b\w/g, l => l.toUpperCase());
     }
 
+    _showLoading() {
+      // Keep whatever is already rendered, only fill an empty list
+      const todoList = this.shadowRoot.querySelector(`.${CSS_CLASSES.TODO_LIST}`);
+      if (todoList && !todoList.children.length) {
+        todoList.innerHTML = `
+          <div class="${CSS_CLASSES.LOADING}">Loading…</div>
+        `;
+      }
+    }
+
     _showError(message) {
       const todoList = this.shadowRoot.querySelector(`.${CSS_CLASSES.TODO_LIST}`);
       if (todoList) {
@@ -570,6 +806,28 @@ if (customElements.get("todo-reset-card")) {
           font-style: italic;
         }
 
+        .${CSS_CLASSES.TODO_ITEM}.${CSS_CLASSES.SELECTED} {
+          color: var(--primary-color);
+          font-weight: 500;
+        }
+
+        .${CSS_CLASSES.SELECT_ACTIONS} {
+          display: none;
+        }
+
+        .${CSS_CLASSES.SELECTING} .${CSS_CLASSES.SELECT_ACTIONS} {
+          display: inline;
+        }
+
+        .${CSS_CLASSES.SELECTING} .${CSS_CLASSES.RESET_BUTTON} {
+          display: none;
+        }
+
+        .${CSS_CLASSES.LOADING} {
+          color: var(--secondary-text-color);
+          padding: 8px 16px;
+        }
+
         .${CSS_CLASSES.CARD_ACTIONS} {
           padding: 8px 16px;
           display: flex;
@@ -585,7 +843,12 @@ if (customElements.get("todo-reset-card")) {
           <div class="${CSS_CLASSES.TODO_LIST}"></div>
         </div>
         <div class="${CSS_CLASSES.CARD_ACTIONS}">
-          <mwc-button>Reset All Items</mwc-button>
+          <span class="${CSS_CLASSES.SELECT_ACTIONS}">
+            <mwc-button data-status="completed">Mark Done</mwc-button>
+            <mwc-button data-status="needs_action">Mark To Do</mwc-button>
+          </span>
+          <mwc-button class="${CSS_CLASSES.SELECT_BUTTON}">Select</mwc-button>
+          <mwc-button class="${CSS_CLASSES.RESET_BUTTON}">Reset All Items</mwc-button>
         </div>
       `;
 
@@ -594,12 +857,18 @@ if (customElements.get("todo-reset-card")) {
       this.shadowRoot.appendChild(card);
 
       // Add event listener for reset button
-      const resetButton = this.shadowRoot.querySelector('mwc-button');
+      const resetButton = this.shadowRoot.querySelector(`.${CSS_CLASSES.RESET_BUTTON}`);
       if (resetButton) {
         resetButton.addEventListener('click', this._boundHandleReset);
       } else {
         console.error("Reset button not found in the shadow DOM");
       }
+
+      // Multi-select buttons
+      this.shadowRoot.querySelector(`.${CSS_CLASSES.SELECT_BUTTON}`)
+        ?.addEventListener('click', this._boundToggleSelectMode);
+      this.shadowRoot.querySelectorAll(`.${CSS_CLASSES.SELECT_ACTIONS} mwc-button`)
+        .forEach(button => button.addEventListener('click', this._boundHandleBulkAction));
     }
 
     connectedCallback() {
@@ -611,10 +880,14 @@ if (customElements.get("todo-reset-card")) {
 
     disconnectedCallback() {
       // Remove event listeners
-      const resetButton = this.shadowRoot.querySelector('mwc-button');
+      const resetButton = this.shadowRoot.querySelector(`.${CSS_CLASSES.RESET_BUTTON}`);
       if (resetButton) {
         resetButton.removeEventListener('click', this._boundHandleReset);
       }
+      this.shadowRoot.querySelector(`.${CSS_CLASSES.SELECT_BUTTON}`)
+        ?.removeEventListener('click', this._boundToggleSelectMode);
+      this.shadowRoot.querySelectorAll(`.${CSS_CLASSES.SELECT_ACTIONS} mwc-button`)
+        .forEach(button => button.removeEventListener('click', this._boundHandleBulkAction));
 
       // Remove item click handlers
       const todoItems = this.shadowRoot.querySelectorAll(`.${CSS_CLASSES.TODO_ITEM}`);
@@ -624,6 +897,7 @@ if (customElements.get("todo-reset-card")) {
 
       // Unsubscribe from events
       this._unsubscribeFromEvents();
+      this._unsubscribeFromItems();
     }
 
     _subscribeToEvents() {
@@ -681,9 +955,10 @@ if (customElements.get("todo-reset-card")) {
     _renderItem(item) {
       const isDone = item.status === "completed";
       const doneClass = isDone ? CSS_CLASSES.DONE : "";
+      const selectedClass = this._selected.has(item.uid) ? CSS_CLASSES.SELECTED : "";
 
       return `
-        <div class="${CSS_CLASSES.TODO_ITEM} ${doneClass}"
+        <div class="${CSS_CLASSES.TODO_ITEM} ${doneClass} ${selectedClass}"
              data-item-id="${item.uid}">
           ${item.summary}
         </div>
@@ -696,7 +971,7 @@ if (customElements.get("todo-reset-card")) {
         const resetEntity = this._hass.states[this._config.entity];
         if (resetEntity) {
           // Check if visibility should change
-          const shouldShow = this._shouldShowCard(resetEntity);
+          const shouldShow = this._shouldShowCard();
 
           // Update visibility if needed
           if (shouldShow && this.style.display === 'none') {
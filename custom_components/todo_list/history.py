@@ -0,0 +1,278 @@
+"""Append-only completion history of reset lists."""
+
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+# One record per item per reset: the last second of the period the reset
+# closes (epoch seconds), interned UID index and a flags byte, bit 0 set
+# when the item was completed
+RECORD = struct.Struct("<IIB")
+FLAG_COMPLETED = 0x01
+
+WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+
+class TodoListHistory:
+    """
+    Completion history of one reset list, kept outside the recorder.
+
+    Records live in ``<entry_id>.log`` as fixed-width structs so the file can
+    be memory-mapped and searched by time. Item UIDs are interned in
+    ``<entry_id>.uids``, one JSON line per UID, so the record index of a UID
+    is its line number. Executor jobs of overlapping resets and queries share
+    the interned UIDs, so reading and extending them happens under a lock.
+    Writes cut short by a crash or a full disk are cut off before the next
+    append and never read, so they cost at most the reset being written.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the history for a config entry."""
+        directory = Path(hass.config.path(".storage", f"{DOMAIN}_history"))
+        self.hass = hass
+        self._directory = directory
+        self._log_path = directory / f"{entry_id}.log"
+        self._uids_path = directory / f"{entry_id}.uids"
+        self._uids: list[dict[str, str] | None] | None = None
+        self._uids_end = 0
+        self._uid_index: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    async def async_record(self, items: list[dict[str, Any]]) -> None:
+        """
+        Append the completion state of the items before a reset.
+
+        Records are stamped one second before the reset, so the day and
+        weekday they count towards are those of the period that just ended:
+        a midnight reset early on Tuesday records Monday.
+        """
+        if items:
+            timestamp = int(dt_util.utcnow().timestamp()) - 1
+            await self.hass.async_add_executor_job(self._append, timestamp, items)
+
+    async def async_query(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        uid: str | None = None,
+    ) -> dict[str, Any]:
+        """Return completion aggregates per item between two dates."""
+        return await self.hass.async_add_executor_job(self._query, start, end, uid)
+
+    async def async_remove(self) -> None:
+        """Delete the history files."""
+        await self.hass.async_add_executor_job(self._remove)
+
+    def _load_uids(self) -> list[dict[str, str] | None]:
+        """Read the interned UIDs once, the caller holds the lock."""
+        if self._uids is None:
+            data = self._uids_path.read_bytes() if self._uids_path.exists() else b""
+
+            # A last line without newline was cut short and is never indexed,
+            # an undecodable line keeps its place so later indexes stay right
+            self._uids_end = data.rfind(b"\n") + 1
+            uids = [
+                self._decode_uid(line)
+                for line in data[: self._uids_end].split(b"\n")[:-1]
+            ]
+            self._uid_index = {
+                entry["uid"]: index
+                for index, entry in enumerate(uids)
+                if entry is not None
+            }
+            self._uids = uids
+        return self._uids
+
+    def _decode_uid(self, line: bytes) -> dict[str, str] | None:
+        """Return one interned UID, None if its line is broken."""
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            entry = None
+        if not isinstance(entry, dict) or "uid" not in entry:
+            _LOGGER.warning("Skipping broken UID line in %s", self._uids_path)
+            return None
+        return entry
+
+    def _append(self, timestamp: int, items: list[dict[str, Any]]) -> None:
+        """Intern new UIDs and append one record per item."""
+        with self._lock:
+            self._append_locked(timestamp, items)
+
+    def _append_locked(self, timestamp: int, items: list[dict[str, Any]]) -> None:
+        """Append under the lock so UIDs and records are written in order."""
+        uids = self._load_uids()
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+        new_uids = []
+        records = bytearray()
+        for item in items:
+            if (index := self._uid_index.get(item["uid"])) is None:
+                index = len(uids)
+                entry = {"uid": item["uid"], "summary": item.get("summary", "")}
+                uids.append(entry)
+                new_uids.append(entry)
+                self._uid_index[item["uid"]] = index
+
+            flags = FLAG_COMPLETED if item["status"] == "completed" else 0
+            records += RECORD.pack(timestamp, index, flags)
+
+        # UIDs first, a record never points at an index that is not on disk
+        if new_uids:
+            data = "".join(f"{json.dumps(entry)}\n" for entry in new_uids).encode()
+            with self._uids_path.open("ab") as file:
+                file.truncate(self._uids_end)
+                file.write(data)
+            self._uids_end += len(data)
+
+        with self._log_path.open("ab") as file:
+            # Drop a partial record so the new ones do not shift out of line
+            size = file.seek(0, os.SEEK_END)
+            if size % RECORD.size:
+                _LOGGER.warning("Dropping partial record in %s", self._log_path)
+                file.truncate(size - size % RECORD.size)
+            file.write(records)
+
+    def _query(
+        self, start: date | None, end: date | None, uid: str | None
+    ) -> dict[str, Any]:
+        """Scan the memory-mapped log and aggregate per item."""
+        # Records up to this size only point at UIDs in this copy
+        with self._lock:
+            uids = list(self._load_uids())
+            only = self._uid_index.get(uid, -1) if uid is not None else None
+            size = self._log_path.stat().st_size if self._log_path.exists() else 0
+
+        start_ts = self._date_timestamp(start) if start else 0
+        end_ts = self._date_timestamp(end + timedelta(days=1)) if end else 2**32
+
+        stats: dict[int, dict[str, Any]] = {}
+        weekdays: dict[int, str] = {}
+        resets: set[int] = set()
+
+        count = size // RECORD.size
+
+        if count:
+            with (
+                self._log_path.open("rb") as file,
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            ):
+                view = memoryview(mapped)
+                try:
+                    # Records are in time order, skip straight to the start
+                    first = self._bisect(view, count, start_ts)
+                    records = RECORD.iter_unpack(
+                        view[first * RECORD.size : count * RECORD.size]
+                    )
+                    for timestamp, index, flags in records:
+                        if timestamp >= end_ts:
+                            break
+                        if only is not None and index != only:
+                            continue
+                        # Left behind by a broken write, nothing to count
+                        if index >= len(uids) or uids[index] is None:
+                            continue
+
+                        resets.add(timestamp)
+                        if timestamp not in weekdays:
+                            weekdays[timestamp] = WEEKDAYS[
+                                dt_util.as_local(
+                                    dt_util.utc_from_timestamp(timestamp)
+                                ).weekday()
+                            ]
+                        self._count(
+                            stats.setdefault(index, self._new_stats()),
+                            weekdays[timestamp],
+                            flags & FLAG_COMPLETED,
+                        )
+                    del records
+                finally:
+                    view.release()
+
+        return {
+            "resets": len(resets),
+            "items": [
+                {
+                    "uid": uids[index]["uid"],
+                    "summary": uids[index]["summary"],
+                    "seen": item["seen"],
+                    "completed": item["completed"],
+                    "completion_rate": round(item["completed"] / item["seen"], 3),
+                    "current_streak": item["current_streak"],
+                    "longest_streak": item["longest_streak"],
+                    "by_weekday": item["by_weekday"],
+                }
+                for index, item in sorted(stats.items())
+            ],
+        }
+
+    @staticmethod
+    def _bisect(view: memoryview, count: int, timestamp: int) -> int:
+        """Return the first record at or after a timestamp."""
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            if RECORD.unpack_from(view, middle * RECORD.size)[0] < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    @staticmethod
+    def _new_stats() -> dict[str, Any]:
+        """Return empty aggregates for one item."""
+        return {
+            "seen": 0,
+            "completed": 0,
+            "current_streak": 0,
+            "longest_streak": 0,
+            "by_weekday": {day: {"seen": 0, "completed": 0} for day in WEEKDAYS},
+        }
+
+    @staticmethod
+    def _count(item: dict[str, Any], weekday: str, completed: int) -> None:
+        """Add one reset of an item to its aggregates."""
+        item["seen"] += 1
+        item["by_weekday"][weekday]["seen"] += 1
+        if completed:
+            item["completed"] += 1
+            item["by_weekday"][weekday]["completed"] += 1
+            item["current_streak"] += 1
+            item["longest_streak"] = max(item["longest_streak"], item["current_streak"])
+        else:
+            item["current_streak"] = 0
+
+    @staticmethod
+    def _date_timestamp(day: date) -> int:
+        """Return the epoch seconds of local midnight on a date."""
+        return int(
+            dt_util.as_utc(
+                datetime.combine(day, datetime.min.time(), dt_util.DEFAULT_TIME_ZONE)
+            ).timestamp()
+        )
+
+    def _remove(self) -> None:
+        """Delete the history files of the entry."""
+        with self._lock:
+            self._log_path.unlink(missing_ok=True)
+            self._uids_path.unlink(missing_ok=True)
+            self._uids = None
+            self._uid_index = {}
+            self._uids_end = 0
@@ -0,0 +1,278 @@
+"""Sensor platform for todo_list integration."""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.components.todo import DOMAIN as TODO_DOMAIN
+from homeassistant.const import PERCENTAGE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import DOMAIN, SENSOR_UPDATE_COOLDOWN
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+    from homeassistant.components.todo import TodoListEntity
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .todo_list import TodoListResetEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TodoListCompletionTracker:
+    """Keep completion counts for a reset list's source todo list."""
+
+    def __init__(self, hass: HomeAssistant, reset_entity: TodoListResetEntity) -> None:
+        """Initialize the tracker."""
+        self.hass = hass
+        self.reset_entity = reset_entity
+        self.completed = 0
+        self.total = 0
+
+        self._source_entity_id: str | None = None
+        self._source: TodoListEntity | None = None
+        self._statuses: dict[str, bool] = {}
+        self._listeners: list[CALLBACK_TYPE] = []
+        self._unsub_items: CALLBACK_TYPE | None = None
+        self._unsub_source_state: CALLBACK_TYPE | None = None
+        self._unsub_reset_state: CALLBACK_TYPE | None = None
+
+        # Coalesce bursts of item changes into one sensor write per cooldown
+        self._debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=SENSOR_UPDATE_COOLDOWN,
+            immediate=True,
+            function=self._async_notify_listeners,
+        )
+
+    @property
+    def remaining(self) -> int:
+        """Return the number of items still to do."""
+        return self.total - self.completed
+
+    @callback
+    def async_start(self) -> None:
+        """Start following the source list and the reset entity."""
+        self._unsub_reset_state = async_track_state_change_event(
+            self.hass, [self.reset_entity.entity_id], self._async_handle_reset_state
+        )
+        self._async_attach()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following the source list and the reset entity."""
+        if self._unsub_reset_state is not None:
+            self._unsub_reset_state()
+            self._unsub_reset_state = None
+        self._async_detach()
+        self._debouncer.async_shutdown()
+        self._listeners.clear()
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for count changes."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            if update_callback in self._listeners:
+                self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_notify_listeners(self) -> None:
+        """Tell the sensors to write their state."""
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def _async_attach(self) -> None:
+        """Subscribe to item updates of the current source list."""
+        source_entity_id = self.reset_entity.source_entity_id
+        component = self.hass.data.get(TODO_DOMAIN)
+        source = component.get_entity(source_entity_id) if component else None
+        if (
+            source_entity_id == self._source_entity_id
+            and source is self._source
+            and self._unsub_source_state is not None
+        ):
+            return
+
+        self._async_detach()
+        self._source_entity_id = source_entity_id
+
+        # The source list may not be loaded yet, or its integration may reload
+        # and replace the entity, so its states tell when to attach again
+        self._unsub_source_state = async_track_state_change_event(
+            self.hass, [source_entity_id], self._async_handle_source_state
+        )
+        if source is None:
+            _LOGGER.debug("Waiting for %s to load", source_entity_id)
+            return
+
+        self._source = source
+        self._unsub_items = source.async_subscribe_updates(self._async_handle_items)
+        self._async_handle_items(
+            [dataclasses.asdict(item) for item in source.todo_items or ()]
+        )
+
+    @callback
+    def _async_detach(self) -> None:
+        """Drop subscriptions and counts for the current source list."""
+        if self._unsub_items is not None:
+            self._unsub_items()
+            self._unsub_items = None
+        if self._unsub_source_state is not None:
+            self._unsub_source_state()
+            self._unsub_source_state = None
+        self._source = None
+        self._statuses = {}
+        self.completed = 0
+        self.total = 0
+
+    @callback
+    def _async_handle_source_state(self, _event: Event) -> None:
+        """Attach again once the source list is loaded or replaced."""
+        self._async_attach()
+
+    @callback
+    def _async_handle_reset_state(self, _event: Event) -> None:
+        """Follow source changes and resets of the reset entity."""
+        self._async_attach()
+        self._debouncer.async_schedule_call()
+
+    @callback
+    def _async_handle_items(self, items: list[dict[str, Any]] | None) -> None:
+        """Apply the difference between the new and the previous item statuses."""
+        if items is None:
+            return
+
+        statuses = {item["uid"]: item["status"] == "completed" for item in items}
+        changed = False
+
+        for uid, done in statuses.items():
+            previous = self._statuses.get(uid)
+            if previous is None:
+                self.total += 1
+                self.completed += done
+                changed = True
+            elif previous != done:
+                self.completed += 1 if done else -1
+                changed = True
+
+        for uid in self._statuses.keys() - statuses.keys():
+            self.total -= 1
+            self.completed -= self._statuses[uid]
+            changed = True
+
+        self._statuses = statuses
+
+        if changed:
+            self._debouncer.async_schedule_call()
+
+
+@dataclass(frozen=True, kw_only=True)
+class TodoListSensorEntityDescription(SensorEntityDescription):
+    """Describes a todo_list sensor."""
+
+    value_fn: Callable[[TodoListCompletionTracker], float | int | datetime | None]
+
+
+def _completion_ratio(tracker: TodoListCompletionTracker) -> float | None:
+    """Return the completed share of the list as a percentage."""
+    if not tracker.total:
+        return None
+    return round(tracker.completed / tracker.total * 100, 1)
+
+
+SENSOR_TYPES: tuple[TodoListSensorEntityDescription, ...] = (
+    TodoListSensorEntityDescription(
+        key="completed",
+        name="Completed",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda tracker: tracker.completed,
+    ),
+    TodoListSensorEntityDescription(
+        key="remaining",
+        name="Remaining",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda tracker: tracker.remaining,
+    ),
+    TodoListSensorEntityDescription(
+        key="completion_ratio",
+        name="Completion",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=_completion_ratio,
+    ),
+    TodoListSensorEntityDescription(
+        key="last_reset",
+        name="Last Reset",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda tracker: tracker.reset_entity.last_reset,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up the completion sensors for a reset list."""
+    reset_entity = hass.data[DOMAIN][entry.entry_id]["entity"]
+
+    tracker = TodoListCompletionTracker(hass, reset_entity)
+    tracker.async_start()
+    entry.async_on_unload(tracker.async_stop)
+
+    async_add_entities(
+        TodoListSensor(tracker, entry, description) for description in SENSOR_TYPES
+    )
+
+
+class TodoListSensor(SensorEntity):
+    """Sensor reporting completion of a reset list."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    entity_description: TodoListSensorEntityDescription
+
+    def __init__(
+        self,
+        tracker: TodoListCompletionTracker,
+        entry: ConfigEntry,
+        description: TodoListSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._tracker = tracker
+        self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, entry.entry_id)})
+
+    @property
+    def native_value(self) -> float | int | datetime | None:
+        """Return the value reported by the tracker."""
+        return self.entity_description.value_fn(self._tracker)
+
+    async def async_added_to_hass(self) -> None:
+        """Write state whenever the tracker reports a change."""
+        self.async_on_remove(
+            self._tracker.async_add_listener(self.async_write_ha_state)
+        )
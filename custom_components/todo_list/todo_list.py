@@ -2,21 +2,51 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, cast
+import time
+from datetime import datetime, timedelta
+from functools import partial
+from typing import TYPE_CHECKING, Any, cast
 
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import Entity
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, DEFAULT_DISPLAY_HOURS, DEFAULT_DISPLAY_POSITION
+from .concurrency import async_get_limiter
+from .const import (
+    DATA_LIMITERS,
+    DOMAIN,
+    EVENT_RESET_COMPLETED,
+    EVENT_RESET_STARTED,
+    DEFAULT_DISPLAY_HOURS,
+    DEFAULT_DISPLAY_POSITION,
+    RESETTING_PUBLISH_DELAY,
+)
 
+if TYPE_CHECKING:
+    from .history import TodoListHistory
 
-class TodoListResetEntity(Entity):
+_LOGGER = logging.getLogger(__name__)
+
+
+# States worth restoring, a reset cut short by a restart is not
+RESTORABLE_STATES = ("idle", "active", "error")
+
+
+class TodoListResetEntity(RestoreEntity):
     """Custom entity that links to a todo entity and adds reset functionality."""
 
     _attr_has_entity_name = True
     _attr_should_poll = True
 
+    # Static configuration, no point storing it with every state change
+    _unrecorded_attributes = frozenset(
+        {"reset_time", "display_position", "display_hours"}
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -25,9 +55,11 @@ class TodoListResetEntity(Entity):
         reset_time: str,
         display_position: str = DEFAULT_DISPLAY_POSITION,
         display_hours: int = DEFAULT_DISPLAY_HOURS,
+        history: TodoListHistory | None = None,
     ) -> None:
         """Initialize the TodoListResetEntity."""
         self.hass = hass
+        self._history = history
         self._entry_id = entry_id
         self._source_entity_id = source_entity_id
         self._reset_time = reset_time
@@ -40,28 +72,62 @@ class TodoListResetEntity(Entity):
         # Set entity_id format
         self.entity_id = f"{DOMAIN}.{source_name}_with_reset"
 
-        # Extract a more readable name for display
-        display_name = source_name.replace("_", " ").title()
-
         # Set a unique ID for the entity
         self._attr_unique_id = f"{DOMAIN}_{entry_id}"
 
-        # Set a friendly name
-        self._attr_name = f"{display_name} With Reset"
+        # Named relative to the list's device, which carries the entry title
+        self._attr_name = "With Reset"
 
         # Initialize state
         self._state = "idle"
+        self._last_reset: datetime | None = None
+        self._last_reset_duration: float | None = None
+        self._resetting_unsub: CALLBACK_TYPE | None = None
+        self._timer_unsub: CALLBACK_TYPE | None = None
+        self._reset_lock = asyncio.Lock()
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the last known state and start the reset timer."""
+        await super().async_added_to_hass()
+
+        # Cards can render from this straight away instead of waiting on a poll
+        if (last_state := await self.async_get_last_state()) is not None:
+            if last_state.state in RESTORABLE_STATES:
+                self._state = last_state.state
+            else:
+                self._state = "active"
+
+            if last_reset := last_state.attributes.get("last_reset"):
+                self._last_reset = dt_util.parse_datetime(last_reset)
+            self._last_reset_duration = last_state.attributes.get("last_reset_duration")
 
         self._setup_timer()
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the reset timer and any pending state publish."""
+        if self._timer_unsub is not None:
+            self._timer_unsub()
+            self._timer_unsub = None
+        self._cancel_resetting_publish()
+
     @property
     def state(self) -> str:
         """Return the state of the entity."""
         return self._state
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return entity specific state attributes."""
+    def source_entity_id(self) -> str:
+        """Return the entity ID of the linked todo list."""
+        return self._source_entity_id
+
+    @property
+    def last_reset(self) -> datetime | None:
+        """Return when the linked todo list was last reset."""
+        return self._last_reset
+
+    @property
+    def display_config(self) -> dict[str, Any]:
+        """Return the settings the card needs to display this list."""
         return {
             "source_entity_id": self._source_entity_id,
             "reset_time": self._reset_time,
@@ -69,6 +135,53 @@ class TodoListResetEntity(Entity):
             "display_hours": self._display_hours,
         }
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return entity specific state attributes."""
+        return {
+            **self.display_config,
+            "last_reset": self._last_reset.isoformat() if self._last_reset else None,
+            "last_reset_duration": self._last_reset_duration,
+            **self._limiter_attributes(),
+        }
+
+    def _limiter_attributes(self) -> dict[str, Any]:
+        """Return what the update limiter has learned about the source list."""
+        limiter = self.hass.data.get(DATA_LIMITERS, {}).get(self._source_entity_id)
+        if limiter is None:
+            return {}
+
+        return {
+            "update_concurrency": limiter.limit,
+            "update_latency": (
+                round(limiter.latency, 3) if limiter.latency is not None else None
+            ),
+        }
+
+    def visibility_window(self, now: datetime | None = None) -> dict[str, str] | None:
+        """Return the current or next window in which the card is shown."""
+        now = now or dt_util.now()
+
+        try:
+            hour, minute, second = map(int, self._reset_time.split(":"))
+            span = timedelta(hours=int(self._display_hours))
+        except (ValueError, AttributeError, TypeError):
+            return None
+
+        reset = now.replace(hour=hour, minute=minute, second=second, microsecond=0)
+
+        # Yesterday's window may still be open, otherwise use the first upcoming one
+        for day in (-1, 0, 1):
+            reset_at = reset + timedelta(days=day)
+            if self._display_position == "before":
+                start, end = reset_at - span, reset_at
+            else:
+                start, end = reset_at, reset_at + span
+            if end > now:
+                return {"start": start.isoformat(), "end": end.isoformat()}
+
+        return None
+
     async def async_update(self) -> None:
         """Update the entity state."""
         # Just set the state to active if the source entity exists
@@ -99,40 +212,133 @@ class TodoListResetEntity(Entity):
             return []
 
     async def async_reset_items(self) -> None:
-        """Reset all items to needs_action."""
-        try:
-            self._state = "resetting"
-            self.async_write_ha_state()
+        """Reset all items to needs_action, one reset at a time."""
+        # The timer and reset_now, or a double tap on the card, can ask at
+        # once, the reset already running covers them all
+        if self._reset_lock.locked():
+            _LOGGER.debug("Reset of %s already in progress", self.entity_id)
+            return
+
+        async with self._reset_lock:
+            await self._async_reset_items()
+
+    async def _async_reset_items(self) -> None:
+        """Reset all items to needs_action and report how it went."""
+        started = time.monotonic()
+        items_reset = 0
+        errors: list[str] = []
 
+        self._async_fire_event(EVENT_RESET_STARTED)
+
+        # Only publish "resetting" if the reset is slow enough to be seen,
+        # fast resets then cost a single state write instead of three
+        self._cancel_resetting_publish()
+        self._resetting_unsub = async_call_later(
+            self.hass, RESETTING_PUBLISH_DELAY, self._async_publish_resetting
+        )
+
+        try:
             # Get items directly from source
             items = await self.async_get_items()
 
-            # Reset completed items
-            for item in items:
-                if item["status"] == "completed":
-                    await self.hass.services.async_call(
-                        "todo",
-                        "update_item",
-                        {
-                            "entity_id": self._source_entity_id,
-                            "item": item["uid"],
-                            "status": "needs_action",
-                        },
-                        blocking=True,
+            # Keep what was done before it is wiped, the history is secondary
+            # and never holds up the reset itself
+            if self._history is not None:
+                try:
+                    await self._history.async_record(items)
+                except Exception:
+                    _LOGGER.exception("Unable to record completion history")
+
+            # Reset completed items, as parallel as the source list allows
+            limiter = async_get_limiter(self.hass, self._source_entity_id)
+            results = await asyncio.gather(
+                *(
+                    limiter.async_run(
+                        partial(self._async_update_item, item["uid"], "needs_action")
                     )
+                    for item in items
+                    if item["status"] == "completed"
+                ),
+                return_exceptions=True,
+            )
 
-            self._state = "reset_complete"
-            self.async_write_ha_state()
-
-            # Schedule state change back to active
-            async def set_active():
+            errors = [
+                str(result) for result in results if isinstance(result, Exception)
+            ]
+            items_reset = len(results) - len(errors)
+            if errors:
+                _LOGGER.error(
+                    "Failed to reset %d item(s) of %s: %s",
+                    len(errors),
+                    self._source_entity_id,
+                    errors[0],
+                )
+                self._state = "error"
+            else:
                 self._state = "active"
-                self.async_write_ha_state()
-
-            self.hass.async_create_task(set_active())
         except Exception as e:
+            _LOGGER.exception("Error resetting todo items")
+            errors.append(str(e))
             self._state = "error"
-            self.async_write_ha_state()
+        finally:
+            self._cancel_resetting_publish()
+
+        self._last_reset = dt_util.utcnow()
+        self._last_reset_duration = round(time.monotonic() - started, 3)
+        self.async_write_ha_state()
+
+        self._async_fire_event(
+            EVENT_RESET_COMPLETED,
+            {
+                "items_reset": items_reset,
+                "duration": self._last_reset_duration,
+                "errors": errors,
+            },
+        )
+
+    @callback
+    def _async_fire_event(
+        self, event_type: str, data: dict[str, Any] | None = None
+    ) -> None:
+        """Fire a reset lifecycle event, keyed by device for device triggers."""
+        device = dr.async_get(self.hass).async_get_device(
+            identifiers={(DOMAIN, self._entry_id)}
+        )
+        self.hass.bus.async_fire(
+            event_type,
+            {
+                "entity_id": self.entity_id,
+                "device_id": device.id if device else None,
+                "source_entity_id": self._source_entity_id,
+                **(data or {}),
+            },
+        )
+
+    async def _async_update_item(self, uid: str, status: str) -> None:
+        """Set the status of one item on the source list."""
+        await self.hass.services.async_call(
+            "todo",
+            "update_item",
+            {
+                "entity_id": self._source_entity_id,
+                "item": uid,
+                "status": status,
+            },
+            blocking=True,
+        )
+
+    @callback
+    def _async_publish_resetting(self, _now: Any) -> None:
+        """Publish the transient resetting state once for a slow reset."""
+        self._resetting_unsub = None
+        self._state = "resetting"
+        self.async_write_ha_state()
+
+    def _cancel_resetting_publish(self) -> None:
+        """Cancel a pending resetting state publish."""
+        if self._resetting_unsub is not None:
+            self._resetting_unsub()
+            self._resetting_unsub = None
 
     def update_settings(
         self,
@@ -163,33 +369,10 @@ class TodoListResetEntity(Entity):
             changed = True
 
         if changed:
-            # Force a state update to reflect the changes
+            # Force a state update to reflect the changes, the name follows
+            # the device and stays the same when the source list changes
             self.async_schedule_update_ha_state(True)
 
-            # Update the entity registry
-            try:
-                from homeassistant.helpers.entity_registry import async_get
-
-                # Get new display name
-                source_name = self._source_entity_id.split(".")[-1]
-                display_name = source_name.replace("_", " ").title()
-                new_name = f"{display_name} With Reset"
-
-                # Update entity registry - don't change the unique_id to avoid conflicts
-                entity_registry = async_get(self.hass)
-                entity_registry.async_update_entity(
-                    self.entity_id,
-                    name=new_name,
-                )
-
-                # Also update the entity attribute
-                self._attr_name = new_name
-
-            except Exception as e:
-                logging.getLogger(__name__).error(
-                    f"Error updating entity registry: {e}"
-                )
-
     def _setup_timer(self) -> None:
         """Set up the timer for resetting items using Home Assistant time trigger."""
         import logging
@@ -200,7 +383,7 @@ class TodoListResetEntity(Entity):
         logger = logging.getLogger(__name__)
 
         # Remove any existing timer
-        if hasattr(self, "_timer_unsub") and self._timer_unsub is not None:
+        if self._timer_unsub is not None:
             self._timer_unsub()
             self._timer_unsub = None
 
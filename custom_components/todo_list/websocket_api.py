@@ -0,0 +1,237 @@
+"""Websocket API for Todo List cards."""
+
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.components.todo import DOMAIN as TODO_DOMAIN
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.components.todo import TodoItem, TodoListEntity
+
+    from .todo_list import TodoListResetEntity
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, websocket_get_items)
+    websocket_api.async_register_command(hass, websocket_subscribe_items)
+
+
+@callback
+def _async_get_reset_entities(hass: HomeAssistant) -> dict[str, TodoListResetEntity]:
+    """Return the loaded reset entities keyed by entity ID."""
+    return {
+        entry_data["entity"].entity_id: entry_data["entity"]
+        for entry_data in hass.data.get(DOMAIN, {}).values()
+        if entry_data.get("entity") is not None
+    }
+
+
+def _serialize_item(item: dict[str, Any]) -> dict[str, Any]:
+    """Drop empty fields the same way todo/item/list does."""
+    return {key: value for key, value in item.items() if value is not None}
+
+
+@callback
+def _async_get_source(
+    hass: HomeAssistant, source_entity_id: str
+) -> TodoListEntity | None:
+    """Return the loaded entity of a source list."""
+    component = hass.data.get(TODO_DOMAIN)
+    return component.get_entity(source_entity_id) if component else None
+
+
+@callback
+def _async_source_items(
+    hass: HomeAssistant, source_entity_id: str
+) -> list[dict[str, Any]] | None:
+    """Return the in-memory items of a source list, None if it is not loaded."""
+    source = _async_get_source(hass, source_entity_id)
+    if source is None:
+        return None
+
+    items: list[TodoItem] = source.todo_items or []
+    return [_serialize_item(dataclasses.asdict(item)) for item in items]
+
+
+@callback
+def _async_entry(
+    hass: HomeAssistant,
+    entity_id: str,
+    reset_entity: TodoListResetEntity | None,
+    items: list[dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """Build the response for one reset entity."""
+    if reset_entity is None:
+        return {"entity_id": entity_id, "error": "not_found"}
+
+    if items is None:
+        items = _async_source_items(hass, reset_entity.source_entity_id)
+
+    return {
+        "entity_id": entity_id,
+        "config": reset_entity.display_config,
+        "visibility": reset_entity.visibility_window(),
+        "items": items,
+    }
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "todo_list/items",
+        vol.Required("entity_ids"): [cv.entity_id],
+    }
+)
+@callback
+def websocket_get_items(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return items, config and visibility for several reset entities."""
+    reset_entities = _async_get_reset_entities(hass)
+    connection.send_result(
+        msg["id"],
+        {
+            "entries": [
+                _async_entry(hass, entity_id, reset_entities.get(entity_id))
+                for entity_id in msg["entity_ids"]
+            ]
+        },
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "todo_list/items/subscribe",
+        vol.Required("entity_ids"): [cv.entity_id],
+    }
+)
+@callback
+def websocket_subscribe_items(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Stream items, config and visibility for several reset entities."""
+    msg_id = msg["id"]
+    entity_ids = list(dict.fromkeys(msg["entity_ids"]))
+
+    # Per reset entity: the source it is attached to, the source entity object
+    # followed and the unsubscribes for its items and its state. Reset
+    # entities are looked up on every event so a reloaded entry is picked up
+    # and the old entity object is not kept alive by this subscription.
+    sources: dict[str, str | None] = {}
+    attached: dict[str, TodoListEntity | None] = {}
+    unsubs: dict[str, list[CALLBACK_TYPE]] = {}
+
+    @callback
+    def async_send(entries: list[dict[str, Any]]) -> None:
+        connection.send_message(
+            websocket_api.event_message(msg_id, {"entries": entries})
+        )
+
+    @callback
+    def async_attach(entity_id: str) -> None:
+        """Follow item updates of the source behind a reset entity."""
+        for unsub in unsubs.pop(entity_id, ()):
+            unsub()
+
+        reset_entity = _async_get_reset_entities(hass).get(entity_id)
+        source_entity_id = reset_entity.source_entity_id if reset_entity else None
+        sources[entity_id] = source_entity_id
+        attached[entity_id] = None
+        if source_entity_id is None:
+            return
+
+        @callback
+        def async_handle_source_state(_event: Event) -> None:
+            """Attach again once the source list is loaded or replaced."""
+            if _async_get_source(hass, source_entity_id) is attached.get(entity_id):
+                return
+            async_attach(entity_id)
+            async_send(
+                [
+                    _async_entry(
+                        hass,
+                        entity_id,
+                        _async_get_reset_entities(hass).get(entity_id),
+                    )
+                ]
+            )
+
+        # The source list may not be loaded yet, or its integration may reload
+        # and replace the entity, so its states tell when to attach again
+        unsubs[entity_id] = [
+            async_track_state_change_event(
+                hass, [source_entity_id], async_handle_source_state
+            )
+        ]
+        source = _async_get_source(hass, source_entity_id)
+        if source is None:
+            return
+        attached[entity_id] = source
+
+        @callback
+        def async_handle_items(items: list[dict[str, Any]] | None) -> None:
+            async_send(
+                [
+                    _async_entry(
+                        hass,
+                        entity_id,
+                        _async_get_reset_entities(hass).get(entity_id),
+                        [_serialize_item(item) for item in items or ()],
+                    )
+                ]
+            )
+
+        unsubs[entity_id].append(source.async_subscribe_updates(async_handle_items))
+
+    @callback
+    def async_handle_reset_state(event: Event) -> None:
+        """Resend config, and reattach when the source list changed."""
+        entity_id = event.data["entity_id"]
+        reset_entity = _async_get_reset_entities(hass).get(entity_id)
+        source_entity_id = reset_entity.source_entity_id if reset_entity else None
+        if source_entity_id != sources.get(entity_id):
+            async_attach(entity_id)
+        async_send([_async_entry(hass, entity_id, reset_entity)])
+
+    for entity_id in entity_ids:
+        async_attach(entity_id)
+
+    # Also covers reset entities that are added or reloaded later
+    unsub_state = async_track_state_change_event(
+        hass, entity_ids, async_handle_reset_state
+    )
+
+    @callback
+    def async_unsubscribe() -> None:
+        unsub_state()
+        for entity_unsubs in unsubs.values():
+            for unsub in entity_unsubs:
+                unsub()
+        unsubs.clear()
+        attached.clear()
+
+    connection.subscriptions[msg_id] = async_unsubscribe
+    connection.send_result(msg_id)
+
+    # Everything the dashboard needs arrives in a single first event
+    reset_entities = _async_get_reset_entities(hass)
+    async_send(
+        [
+            _async_entry(hass, entity_id, reset_entities.get(entity_id))
+            for entity_id in entity_ids
+        ]
+    )